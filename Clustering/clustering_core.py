@@ -0,0 +1,80 @@
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# fastcluster's NN-chain average linkage is a drop-in for scipy's and much
+# faster on large cell counts; fall back to scipy when it isn't installed
+try:
+    from fastcluster import linkage
+except ImportError:
+    from scipy.cluster.hierarchy import linkage
+
+# ==================================================
+# Shared clustering setup (personC / step3 scripts)
+# ==================================================
+
+
+def load_similarity(path):
+    """
+    Load a square similarity matrix with integer cell labels.
+
+    Reads through a Parquet sidecar next to the CSV, rebuilt whenever the
+    CSV is newer, so repeat runs skip parsing the n x n text matrix.
+    """
+    path = Path(path)
+    parquet_path = path.with_suffix(".parquet")
+
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= path.stat().st_mtime:
+        similarity = pd.read_parquet(parquet_path, engine="pyarrow")
+    else:
+        similarity = pd.read_csv(path, index_col=0)
+        similarity.columns = similarity.columns.astype(str)  # parquet needs str names
+        try:
+            similarity.to_parquet(parquet_path, engine="pyarrow", compression="zstd")
+        except OSError:
+            pass  # read-only location: keep going without the cache
+
+    # Normalize labels
+    similarity.index = similarity.index.astype(int)
+    similarity.columns = similarity.columns.astype(int)
+    similarity = similarity.loc[similarity.index, similarity.index]
+
+    assert similarity.shape[0] == similarity.shape[1], "Similarity matrix must be square"
+    return similarity
+
+
+def condensed_distance(similarity):
+    """1 - similarity as a condensed (row-major upper triangle) vector."""
+    values = similarity.to_numpy(dtype=np.float64)
+    # Only the upper triangle is gathered and converted (no n x n distance copy)
+    return 1.0 - values[np.triu_indices(values.shape[0], k=1)]
+
+
+def compute_linkage(condensed, cache_dir=None):
+    """
+    Average linkage over a condensed distance vector.
+
+    With cache_dir set, the result is persisted there, keyed on a hash of
+    the distance bytes, and reused across runs until the similarity
+    matrix changes.
+    """
+    key = hashlib.blake2b(condensed.tobytes(), digest_size=16).digest()
+    linkage_matrix = None
+
+    cache_path = Path(cache_dir) / "linkage_cache.npz" if cache_dir else None
+    if cache_path is not None and cache_path.exists():
+        with np.load(cache_path) as cached:
+            if cached["key"].tobytes() == key:
+                linkage_matrix = cached["linkage"]
+
+    if linkage_matrix is None:
+        linkage_matrix = linkage(condensed, method="average")
+        if cache_path is not None:
+            try:
+                np.savez(cache_path, key=np.frombuffer(key, dtype=np.uint8), linkage=linkage_matrix)
+            except OSError:
+                pass  # read-only location: keep going without the cache
+
+    return linkage_matrix
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
@@ -22,7 +23,19 @@ groups_df = (
       .sort_values("cell_id")
 )
 
-groups_df.to_csv(DST, index=False)
+# Both columns are plain integers in the normal case: write them straight
+# from NumPy and skip pandas' per-row CSV writer
+if all(pd.api.types.is_integer_dtype(groups_df[col]) for col in groups_df.columns):
+    np.savetxt(
+        DST,
+        groups_df.to_numpy(dtype=np.int64),
+        fmt="%d",
+        delimiter=",",
+        header="cell_id,group_id",
+        comments="",
+    )
+else:
+    groups_df.to_csv(DST, index=False)
 
 print("[OK] groups.csv exported for ML / API")
 print("Cells:", groups_df["cell_id"].nunique())
@@ -1,8 +1,13 @@
+import itertools
+
 import pandas as pd
-from scipy.cluster.hierarchy import linkage, fcluster
-from scipy.spatial.distance import squareform
+import networkx as nx
+import matplotlib.pyplot as plt
+from scipy.cluster.hierarchy import fcluster
 from pathlib import Path
 
+from clustering_core import load_similarity, condensed_distance, compute_linkage
+
 # ==================================================
 # Paths
 # ==================================================
@@ -15,22 +20,12 @@ SIMILARITY_PATH = OUT_DIR / "similarity_matrix.csv"
 # ==================================================
 # Load similarity matrix
 # ==================================================
-similarity = pd.read_csv(SIMILARITY_PATH, index_col=0)
-
-# Normalize labels
-similarity.index = similarity.index.astype(int)
-similarity.columns = similarity.columns.astype(int)
-similarity = similarity.loc[similarity.index, similarity.index]
-
-assert similarity.shape[0] == similarity.shape[1], "Similarity matrix must be square"
+similarity = load_similarity(SIMILARITY_PATH)
 
 # ==================================================
 # Hierarchical clustering (relative topology)
 # ==================================================
-distance_matrix = 1.0 - similarity
-condensed_distance = squareform(distance_matrix.values, checks=False)
-
-linkage_matrix = linkage(condensed_distance, method="average")
+linkage_matrix = compute_linkage(condensed_distance(similarity), cache_dir=OUT_DIR)
 
 DISTANCE_THRESHOLD = 0.6
 cluster_labels = fcluster(
@@ -99,16 +94,13 @@ topology_table.to_csv("outputs/relative_fronthaul_groups.csv", index=False)
 # ==================================================
 G = nx.Graph()
 
-# Add nodes
-for cell in similarity.index:
-    grp = topology_table.loc[topology_table.cell_id == cell, "relative_group"].values[0]
-    G.add_node(cell, group=grp)
+# Add nodes (cell -> group lookup built once)
+cell_groups = dict(zip(topology_table["cell_id"], topology_table["relative_group"]))
+G.add_nodes_from((cell, {"group": cell_groups[cell]}) for cell in similarity.index)
 
 # Connect nodes within same group
-for grp, cells in grouped_cells.items():
-    for i in range(len(cells)):
-        for j in range(i + 1, len(cells)):
-            G.add_edge(cells[i], cells[j])
+for cells in grouped_cells.values():
+    G.add_edges_from(itertools.combinations(cells, 2))
 
 # Draw graph
 plt.figure(figsize=(10, 8))
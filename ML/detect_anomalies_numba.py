@@ -0,0 +1,164 @@
+import numpy as np
+from numba import njit, prange
+
+# ================================
+# Sliding-window median (two heaps)
+# ================================
+# lo = max-heap (lower half, keys stored negated), hi = min-heap (upper half).
+# Each heap keeps its keys next to the slot indices so sifting never gathers
+# from x; an index is stale once it falls out of the window and is only
+# dropped when it reaches the top (lazy deletion).
+
+
+@njit(cache=True, inline="always")
+def _sift_up(keys, idxs, pos):
+    key = keys[pos]
+    item = idxs[pos]
+    while pos > 0:
+        parent = (pos - 1) >> 1
+        if keys[parent] <= key:
+            break
+        keys[pos] = keys[parent]
+        idxs[pos] = idxs[parent]
+        pos = parent
+    keys[pos] = key
+    idxs[pos] = item
+
+
+@njit(cache=True, inline="always")
+def _sift_down(keys, idxs, size):
+    pos = 0
+    key = keys[0]
+    item = idxs[0]
+    while True:
+        child = 2 * pos + 1
+        if child >= size:
+            break
+        if child + 1 < size and keys[child + 1] < keys[child]:
+            child += 1
+        if key <= keys[child]:
+            break
+        keys[pos] = keys[child]
+        idxs[pos] = idxs[child]
+        pos = child
+    keys[pos] = key
+    idxs[pos] = item
+
+
+@njit(cache=True, inline="always")
+def _push(keys, idxs, size, key, idx):
+    keys[size] = key
+    idxs[size] = idx
+    _sift_up(keys, idxs, size)
+    return size + 1
+
+
+@njit(cache=True, inline="always")
+def _pop(keys, idxs, size):
+    size -= 1
+    if size > 0:
+        keys[0] = keys[size]
+        idxs[0] = idxs[size]
+        _sift_down(keys, idxs, size)
+    return size
+
+
+@njit(cache=True, inline="always")
+def _prune(keys, idxs, size, oldest):
+    while size > 0 and idxs[0] < oldest:
+        size = _pop(keys, idxs, size)
+    return size
+
+
+@njit(cache=True)
+def rolling_median(x, window, min_periods):
+    """
+    Trailing rolling median over x, matching
+    pd.Series(x).rolling(window, min_periods).median().
+
+    NaNs are skipped and do not count towards min_periods.
+    O(log W) per step instead of a partial sort of the window.
+    """
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+
+    lo_keys = np.empty(n)
+    lo_idxs = np.empty(n, dtype=np.int64)
+    hi_keys = np.empty(n)
+    hi_idxs = np.empty(n, dtype=np.int64)
+    side = np.zeros(n, dtype=np.int8)  # 0 -> lo, 1 -> hi
+    lo_size = 0
+    hi_size = 0
+    lo_live = 0
+    hi_live = 0
+
+    for i in range(n):
+        v = x[i]
+        if not np.isnan(v):
+            if lo_live == 0 or v <= -lo_keys[0]:
+                lo_size = _push(lo_keys, lo_idxs, lo_size, -v, i)
+                side[i] = 0
+                lo_live += 1
+            else:
+                hi_size = _push(hi_keys, hi_idxs, hi_size, v, i)
+                side[i] = 1
+                hi_live += 1
+
+        j = i - window
+        if j >= 0 and not np.isnan(x[j]):
+            if side[j] == 0:
+                lo_live -= 1
+            else:
+                hi_live -= 1
+
+        oldest = j + 1
+        lo_size = _prune(lo_keys, lo_idxs, lo_size, oldest)
+        hi_size = _prune(hi_keys, hi_idxs, hi_size, oldest)
+
+        # Rebalance so that lo_live == hi_live or lo_live == hi_live + 1
+        while lo_live > hi_live + 1:
+            value = -lo_keys[0]
+            idx = lo_idxs[0]
+            lo_size = _pop(lo_keys, lo_idxs, lo_size)
+            hi_size = _push(hi_keys, hi_idxs, hi_size, value, idx)
+            side[idx] = 1
+            lo_live -= 1
+            hi_live += 1
+            lo_size = _prune(lo_keys, lo_idxs, lo_size, oldest)
+        while hi_live > lo_live:
+            value = hi_keys[0]
+            idx = hi_idxs[0]
+            hi_size = _pop(hi_keys, hi_idxs, hi_size)
+            lo_size = _push(lo_keys, lo_idxs, lo_size, -value, idx)
+            side[idx] = 0
+            hi_live -= 1
+            lo_live += 1
+            hi_size = _prune(hi_keys, hi_idxs, hi_size, oldest)
+
+        count = lo_live + hi_live
+        if count >= min_periods and count > 0:
+            if count % 2 == 1:
+                out[i] = -lo_keys[0]
+            else:
+                out[i] = (-lo_keys[0] + hi_keys[0]) / 2.0
+
+    return out
+
+
+@njit(parallel=True, cache=True)
+def rolling_median_segments(x, bounds, window, min_periods):
+    """
+    rolling_median over each contiguous segment x[bounds[k]:bounds[k + 1]]
+    (one segment per cell). Segments are independent, so they are spread
+    across threads with prange; set NUMBA_NUM_THREADS to pin the count.
+    """
+    out = np.empty_like(x)
+    for k in prange(bounds.shape[0] - 1):
+        start = bounds[k]
+        end = bounds[k + 1]
+        out[start:end] = rolling_median(x[start:end], window, min_periods)
+    return out
+
+
+# Compile once at import so the first real call doesn't pay the JIT cost
+rolling_median_segments(np.zeros(4), np.array([0, 2, 4]), 2, 1)
@@ -0,0 +1,43 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from pathlib import Path
+
+# ================================
+# Parquet cache for CSV pipeline tables
+# ================================
+# The CSVs stay the contract between stages; a .parquet sidecar next to each
+# one is (re)built on first read and used as long as it is newer than the CSV.
+
+# Known column types, so the CSV reader skips inference and ids land compact
+THROUGHPUT_COLUMN_TYPES = {
+    "slot_id": pa.int32(),
+    "cell_id": pa.int16(),
+    "throughput_slot": pa.float64(),
+}
+
+
+def read_csv_cached(csv_path: Path, column_types=None) -> pd.DataFrame:
+    csv_path = Path(csv_path)
+    parquet_path = csv_path.with_suffix(".parquet")
+
+    if parquet_path.exists() and (
+        not csv_path.exists()
+        or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime
+    ):
+        return pd.read_parquet(parquet_path, engine="pyarrow")
+
+    table = pacsv.read_csv(
+        csv_path,
+        convert_options=pacsv.ConvertOptions(column_types=column_types or {}),
+    )
+    try:
+        pq.write_table(table, parquet_path, compression="zstd")
+    except OSError:
+        pass  # read-only location: keep going without the cache
+    return table.to_pandas()
+
+
+def load_throughput(csv_path: Path) -> pd.DataFrame:
+    return read_csv_cached(csv_path, THROUGHPUT_COLUMN_TYPES)
@@ -2,56 +2,84 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
+from detect_anomalies_numba import rolling_median_segments
+from io_utils import load_throughput
+
 BASE_DIR = Path(__file__).resolve().parents[1]
 PRE_OUT = BASE_DIR / "Preprocessing" / "outputs"
 ML_OUT = BASE_DIR / "ML" / "outputs"
 ML_OUT.mkdir(exist_ok=True)
 
-tp = pd.read_csv(PRE_OUT / "multicell_throughputdata.csv")
+tp = load_throughput(PRE_OUT / "multicell_throughputdata.csv")
+
+# Sort once by (cell, slot); stable, so duplicate rows keep their input order
+tp = tp.sort_values(["cell_id", "slot_id"], kind="stable").reset_index(drop=True)
 
-# 🔧 FIX: collapse duplicates
-tp = (
-    tp.groupby(["cell_id", "slot_id"], as_index=False)
-      .agg({"throughput_slot": "mean"})
-)
+cells = tp["cell_id"].to_numpy()
+slots = tp["slot_id"].to_numpy()
+throughput = tp["throughput_slot"].to_numpy(dtype=np.float64)
 
-tp = tp.sort_values(["cell_id", "slot_id"])
+# 🔧 FIX: collapse duplicates (adjacent after sorting; usually there are none)
+new_key = np.r_[True, (cells[1:] != cells[:-1]) | (slots[1:] != slots[:-1])]
+if not new_key.all():
+    starts = np.flatnonzero(new_key)
+    present = ~np.isnan(throughput)
+    sums = np.add.reduceat(np.where(present, throughput, 0.0), starts)
+    counts = np.add.reduceat(present.astype(np.int64), starts)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # NaN-skipping mean, like groupby.mean; pandas sums with Kahan
+        # compensation, so means can differ from it by floating-point rounding
+        throughput = sums / counts
+    cells = cells[starts]
+    slots = slots[starts]
 
 WINDOW = 100
 DROP_RATIO = 0.30  # FIX: Increased from 0.15 - 30% drop is more significant
 
-rows = []
-
-for cell_id, df in tp.groupby("cell_id"):
-    df = df.copy()
-
-    df["baseline"] = (
-        df["throughput_slot"]
-        .rolling(WINDOW, min_periods=30)
-        .median()
-    )
-
-    df["drop_ratio"] = (
-        (df["baseline"] - df["throughput_slot"])
-        / (df["baseline"] + 1e-6)
-    )
+# Rolling baseline per cell: rows are sorted by cell, so each cell is one
+# contiguous segment; cell boundaries come from one adjacent-difference scan
+# (no re-sort via np.unique) and segments run in parallel
+bounds = np.flatnonzero(np.r_[True, cells[1:] != cells[:-1], True])
 
-    df["anomaly"] = (df["drop_ratio"] > DROP_RATIO).astype(int)
+baseline = rolling_median_segments(throughput, bounds, WINDOW, 30)
 
-    # FIX: Better confidence calculation - scales from 0 at threshold to 1 at 2x threshold
-    # This gives gradual confidence instead of immediate clip to 1.0
-    df["confidence"] = (
-        (df["drop_ratio"] - DROP_RATIO) / DROP_RATIO  # 0 at threshold, 1 at 2x threshold
-    ).clip(0.0, 1.0)
+# Drop ratio and confidence computed in place on two buffers; values match
+# the former per-column pandas arithmetic up to floating-point rounding
+# (last-bit differences, ~1e-16, in a handful of confidence values)
+drop_ratio = np.subtract(baseline, throughput)
+with np.errstate(invalid="ignore"):
+    np.divide(drop_ratio, baseline + 1e-6, out=drop_ratio)
+    anomaly = drop_ratio > DROP_RATIO
 
-    df.loc[df["anomaly"] == 0, "confidence"] = 0.0
+# FIX: Better confidence calculation - scales from 0 at threshold to 1 at 2x threshold
+# This gives gradual confidence instead of immediate clip to 1.0
+# The scaled ratio is > 0 exactly when the slot is anomalous, so one clamp
+# covers the masking too: fmax maps negatives and NaN (no baseline) to 0
+confidence = np.subtract(drop_ratio, DROP_RATIO)
+np.divide(confidence, DROP_RATIO, out=confidence)  # 0 at threshold, 1 at 2x threshold
+np.fmax(confidence, 0.0, out=confidence)
+np.minimum(confidence, 1.0, out=confidence)
 
-    rows.append(
-        df[["slot_id", "cell_id", "anomaly", "confidence"]]
-    )
+# Build the output frame once from the arrays
+anomaly_df = pd.DataFrame({
+    "slot_id": slots,
+    "cell_id": cells,
+    "anomaly": anomaly.astype(np.int8),
+    "confidence": confidence,
+})
+anomaly_df.to_csv(ML_OUT / "cell_anomalies.csv", index=False)  # API / report contract
+anomaly_df.to_parquet(ML_OUT / "cell_anomalies.parquet", compression="zstd", index=False)
 
-anomaly_df = pd.concat(rows, ignore_index=True)
-anomaly_df.to_csv(ML_OUT / "cell_anomalies.csv", index=False)
+# Per-cell aggregates for the API copilot context (rows are already grouped
+# by cell, so each cell's sums are one reduceat over its segment)
+seg_starts = bounds[:-1]
+seg_sizes = np.diff(bounds)
+cell_stats = pd.DataFrame({
+    "cell_id": cells[seg_starts],
+    "anomaly_mean": np.add.reduceat(anomaly, seg_starts, dtype=np.int64) / seg_sizes,
+    "confidence_mean": np.add.reduceat(confidence, seg_starts) / seg_sizes,
+})
+cell_stats.to_parquet(ML_OUT / "cell_stats.parquet", index=False)
 
 print("[DONE] Anomaly detection complete")
 print("Cells:", anomaly_df["cell_id"].nunique())
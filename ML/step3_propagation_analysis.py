@@ -1,7 +1,7 @@
+import sys
 import pandas as pd
 import numpy as np
-from scipy.cluster.hierarchy import linkage, fcluster
-from scipy.spatial.distance import squareform
+from scipy.cluster.hierarchy import fcluster
 from pathlib import Path
 
 # ==================================================
@@ -14,35 +14,25 @@ OUT_DIR.mkdir(exist_ok=True)
 SIMILARITY_PATH = OUT_DIR / "similarity_matrix.csv"
 OUTPUT_FILE = OUT_DIR / "relative_fronthaul_groups.csv"
 
+sys.path.insert(0, str(BASE_DIR / "Clustering"))
+from clustering_core import load_similarity, condensed_distance, compute_linkage
+
 # ==================================================
 # Load similarity matrix
 # ==================================================
-similarity = pd.read_csv(SIMILARITY_PATH, index_col=0)
-
-# Normalize labels
-similarity.index = similarity.index.astype(int)
-similarity.columns = similarity.columns.astype(int)
-similarity = similarity.loc[similarity.index, similarity.index]
-
-# Sanity check
-assert similarity.shape[0] == similarity.shape[1], "Similarity matrix must be square"
+similarity = load_similarity(SIMILARITY_PATH)
 
 # ==================================================
 # Similarity → Distance
 # ==================================================
-distance_matrix = 1.0 - similarity
-condensed_distance = squareform(distance_matrix.values, checks=False)
+upper_triangle = condensed_distance(similarity)
 
 # ==================================================
 # Hierarchical clustering (RELATIVE topology only)
 # ==================================================
-linkage_matrix = linkage(condensed_distance, method="average")
+linkage_matrix = compute_linkage(upper_triangle, cache_dir=OUT_DIR)
 
 # Adaptive cut (robust, no hallucination)
-upper_triangle = distance_matrix.values[
-    np.triu_indices_from(distance_matrix, k=1)
-]
-
 DISTANCE_THRESHOLD = np.median(upper_triangle) + 0.5 * np.std(upper_triangle)
 
 cluster_labels = fcluster(
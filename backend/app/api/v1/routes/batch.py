@@ -3,7 +3,7 @@
 Batch processing API endpoints.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
 from app.api.v1.schemas import (
     BatchAnalysisRequest,
@@ -44,7 +44,7 @@ async def full_analysis(request: BatchAnalysisRequest) -> BatchAnalysisResponse:
 
 
 @router.get("/status/{batch_id}", response_model=BatchStatusResponse)
-async def get_batch_status(batch_id: str) -> BatchStatusResponse:
+async def get_batch_status(batch_id: str) -> Response:
     """
     Check status of a batch analysis job.
     
@@ -53,4 +53,7 @@ async def get_batch_status(batch_id: str) -> BatchStatusResponse:
     result = batch_service.get_batch_status(batch_id)
     if not result:
         raise HTTPException(status_code=404, detail=f"Batch job not found: {batch_id}")
-    return BatchStatusResponse(**result)
+    # Polled repeatedly while a batch runs: the service dict is already
+    # response-shaped, so skip validation and serialize in pydantic-core
+    status = BatchStatusResponse.from_trusted(**result)
+    return Response(status.to_json_bytes(), media_type="application/json")
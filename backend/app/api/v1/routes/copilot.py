@@ -3,7 +3,7 @@
 LLM Copilot API endpoints.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
 from app.api.v1.schemas import (
     GenerateInsightsRequest,
@@ -30,7 +30,7 @@ async def generate_insights(request: GenerateInsightsRequest) -> GenerateInsight
             topology_id=request.topology_id,
             anomaly_id=request.anomaly_id,
             propagation_id=request.propagation_id,
-            context=request.context.model_dump() if request.context else None,
+            context=request.context,
         )
         return GenerateInsightsResponse(**result)
     except ValueError as e:
@@ -40,14 +40,15 @@ async def generate_insights(request: GenerateInsightsRequest) -> GenerateInsight
 
 
 @router.get("/report/{report_id}", response_model=CopilotReport)
-async def get_report(report_id: str) -> CopilotReport:
+async def get_report(report_id: str) -> Response:
     """
     Retrieve generated copilot report.
     """
     result = copilot_service.get_report(report_id)
     if not result:
         raise HTTPException(status_code=404, detail=f"Report not found: {report_id}")
-    return CopilotReport(**result)
+    report = CopilotReport.from_trusted(**result)
+    return Response(report.to_json_bytes(), media_type="application/json")
 
 
 @router.post("/query", response_model=QueryResponse)
@@ -61,7 +62,7 @@ async def query(request: QueryRequest) -> QueryResponse:
     try:
         result = await copilot_service.query(
             query=request.query,
-            context=request.context.model_dump() if request.context else None,
+            context=request.context,
         )
         return QueryResponse(**result)
     except Exception as e:
@@ -8,11 +8,21 @@ from fastapi import APIRouter, HTTPException
 from app.api.v1.schemas import (
     DataUploadRequest,
     DataUploadResponse,
+    LOSS_EVENTS_ADAPTER,
+    METADATA_ADAPTER,
+    THROUGHPUT_ADAPTER,
 )
+from app.core.exceptions import APIException, ValidationError
 from app.services.data_service import data_service
 
 router = APIRouter()
 
+# Inline record validators per data_type
+_RECORD_ADAPTERS = {
+    "loss_events": LOSS_EVENTS_ADAPTER,
+    "throughput": THROUGHPUT_ADAPTER,
+}
+
 
 @router.post("/upload", response_model=DataUploadResponse)
 async def upload_data(request: DataUploadRequest) -> DataUploadResponse:
@@ -22,14 +32,49 @@ async def upload_data(request: DataUploadRequest) -> DataUploadResponse:
     Accepts loss_events or throughput data in CSV format.
     Data can be provided inline or via file URL.
     """
+    adapter = _RECORD_ADAPTERS.get(request.data_type)
+    if adapter is None:
+        raise ValidationError(
+            f"Unknown data_type: {request.data_type}",
+            details={"allowed": list(_RECORD_ADAPTERS)},
+        )
+    
     try:
+        data = request.data
+        columns = None
+        if request.format == "columnar":
+            if request.batch is None:
+                raise ValidationError("format 'columnar' requires a batch")
+            if request.data_type != "loss_events":
+                raise ValidationError("Columnar batches are only supported for loss_events")
+            columns = request.batch.to_columns()
+        elif request.format == "csv":
+            if request.batch is not None:
+                raise ValidationError("A batch requires format 'columnar'")
+            if data:
+                # One typed pass over all records (pydantic's ValidationError is a ValueError)
+                data = adapter.validate_python(data)
+        else:
+            raise ValidationError(
+                f"Unknown format: {request.format}",
+                details={"allowed": ["csv", "columnar"]},
+            )
+        
+        # Store metadata as plain JSON values, as it was before timestamps were parsed
+        metadata = request.metadata
+        if metadata is not None:
+            metadata = METADATA_ADAPTER.dump_python(metadata, mode="json")
+        
         result = data_service.upload_data(
             data_type=request.data_type,
-            data=request.data,
+            data=data,
+            columns=columns,
             file_url=request.file_url,
-            metadata=request.metadata.model_dump() if request.metadata else None,
+            metadata=metadata,
         )
         return DataUploadResponse(**result)
+    except APIException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
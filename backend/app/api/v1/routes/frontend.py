@@ -6,14 +6,31 @@ These endpoints match exactly what the React frontend expects,
 as documented in Frontend/InstructionsToIntegrate.md.
 """
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
-from typing import Any, Dict, List, Optional
 
+from app.core.responses import ORJSONResponse, orjson_dumps
+from app.providers.base import ChatMessage
+from app.providers.registry import get_provider
+from app.services.copilot_service import copilot_service
 from app.services.frontend_service import frontend_service
 
 router = APIRouter()
 
+PROJECT_ROOT = Path(__file__).resolve().parents[5]
+ANOMALY_PATH = PROJECT_ROOT / "ML" / "outputs" / "cell_anomalies.csv"
+GROUPS_PATH = PROJECT_ROOT / "Clustering" / "outputs" / "relative_fronthaul_groups.csv"
+
 
 # ============================================================
 # Response Models
@@ -84,9 +101,174 @@ class ChatResponse(BaseModel):
     suggestedActions: List[str] = []
 
 
+# ============================================================
+# Network Context (LLM prompts)
+# ============================================================
+# Blocking pandas/file I/O: the async handlers run these via
+# asyncio.to_thread so CSV parsing never stalls the event loop.
+# Parsed tables and rendered strings are memoized per (path, mtime_ns),
+# so a request only re-reads a CSV after the pipeline rewrites it.
+# The stat result itself (including "missing") is reused for a few seconds,
+# so steady-state requests don't touch the filesystem at all.
+
+_STAT_TTL = 5.0  # seconds
+_stat_cache: Dict[Path, Tuple[float, Optional[int]]] = {}  # path -> (checked_at, mtime_ns)
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """File modification time (cache key), or None if it doesn't exist."""
+    now = time.monotonic()
+    cached = _stat_cache.get(path)
+    if cached is not None and now - cached[0] < _STAT_TTL:
+        return cached[1]
+    
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+    _stat_cache[path] = (now, mtime_ns)
+    return mtime_ns
+
+
+@lru_cache(maxsize=4)
+def _load_cell_stats(path_str: str, mtime_ns: int) -> pd.DataFrame:
+    """
+    Per-cell anomaly rate and mean confidence for cell_anomalies.csv.
+    
+    Uses the cell_stats.parquet aggregate that the ML pipeline writes next
+    to the CSV when it is at least as new; otherwise aggregates the CSV.
+    """
+    stats_path = Path(path_str).with_name("cell_stats.parquet")
+    stats_mtime_ns = _mtime_ns(stats_path)
+    if stats_mtime_ns is not None and stats_mtime_ns >= mtime_ns:
+        stats = pd.read_parquet(stats_path, engine="pyarrow")
+        return stats.rename(columns={"anomaly_mean": "anomaly", "confidence_mean": "confidence"})
+    
+    df = pd.read_csv(path_str, usecols=["cell_id", "anomaly", "confidence"])
+    
+    # groupby(...).mean() as bincount sums over the small integer ids
+    cell_ids = df["cell_id"].to_numpy(np.int64)
+    counts = np.bincount(cell_ids)
+    present = np.flatnonzero(counts)
+    return pd.DataFrame({
+        "cell_id": present,
+        "anomaly": np.bincount(cell_ids, weights=df["anomaly"].to_numpy(np.float64))[present] / counts[present],
+        "confidence": np.bincount(cell_ids, weights=df["confidence"].to_numpy(np.float64))[present] / counts[present],
+    })
+
+
+def _top_rows(cell_stats: pd.DataFrame, n: int) -> pd.DataFrame:
+    """cell_stats.nlargest(n, "anomaly"): stable, so ties keep cell order."""
+    order = np.argsort(-cell_stats["anomaly"].to_numpy(), kind="stable")[:n]
+    return cell_stats.iloc[order]
+
+
+def _top_anomalies_context() -> str:
+    """Short top-3 anomaly summary for recommendation expansion."""
+    mtime_ns = _mtime_ns(ANOMALY_PATH)
+    if mtime_ns is None:
+        return ""
+    return _render_top_anomalies(str(ANOMALY_PATH), mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _render_top_anomalies(path_str: str, mtime_ns: int) -> str:
+    cell_stats = _load_cell_stats(path_str, mtime_ns)
+    top_anomalies = _top_rows(cell_stats, 3)
+    summary = ", ".join(
+        f"Cell {int(cell_id)} ({rate*100:.0f}%)"
+        for cell_id, rate in zip(top_anomalies["cell_id"].to_numpy(), top_anomalies["anomaly"].to_numpy())
+    )
+    return f"Top anomalies: {summary}"
+
+
+def _anomaly_context() -> str:
+    """Anomaly detection section of the copilot system prompt."""
+    mtime_ns = _mtime_ns(ANOMALY_PATH)
+    if mtime_ns is None:
+        return ""
+    return _render_anomaly_context(str(ANOMALY_PATH), mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _render_anomaly_context(path_str: str, mtime_ns: int) -> str:
+    cell_stats = _load_cell_stats(path_str, mtime_ns)
+    
+    # Identify anomalous cells (>25% rate)
+    anomalous = cell_stats[cell_stats["anomaly"] > 0.25]
+    healthy = cell_stats[cell_stats["anomaly"] <= 0.25]
+    
+    # Lines are formatted straight from the column arrays and joined once
+    # (no iterrows, no quadratic string +=)
+    lines = [f"""
+ANOMALY DETECTION RESULTS:
+- Total cells monitored: {len(cell_stats)}
+- Anomalous cells (>25% throughput drop rate): {len(anomalous)}
+- Healthy cells: {len(healthy)}
+- Threshold: 30% throughput drop from rolling median baseline
+
+ANOMALOUS CELLS DETAIL:
+"""]
+    lines.extend(
+        f"- Cell {int(cell_id)}: {rate*100:.1f}% of time slots show anomaly, avg confidence {confidence*100:.1f}%\n"
+        for cell_id, rate, confidence in zip(
+            anomalous["cell_id"].to_numpy(),
+            anomalous["anomaly"].to_numpy(),
+            anomalous["confidence"].to_numpy(),
+        )
+    )
+    
+    if len(anomalous) == 0:
+        lines.append("- No cells currently exceed the 25% anomaly rate threshold\n")
+    
+    lines.append("""
+TOP 5 CELLS BY ANOMALY RATE:
+""")
+    top = _top_rows(cell_stats, 5)
+    top_rates = top["anomaly"].to_numpy()
+    statuses = np.where(top_rates > 0.25, "⚠️ FLAGGED", "✓ healthy")
+    lines.extend(
+        f"- Cell {int(cell_id)}: {rate*100:.1f}% rate ({status})\n"
+        for cell_id, rate, status in zip(top["cell_id"].to_numpy(), top_rates, statuses)
+    )
+    
+    return "".join(lines)
+
+
+def _topology_context() -> str:
+    """Topology clustering section of the copilot system prompt."""
+    mtime_ns = _mtime_ns(GROUPS_PATH)
+    if mtime_ns is None:
+        return ""
+    return _render_topology_context(str(GROUPS_PATH), mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _render_topology_context(path_str: str, mtime_ns: int) -> str:
+    groups_df = pd.read_csv(path_str)
+    n_groups = groups_df["relative_group"].nunique()
+    lines = [f"""
+TOPOLOGY CLUSTERING:
+- {n_groups} distinct fronthaul link groups identified
+- Cells in same group share similar congestion patterns (likely shared infrastructure)
+
+GROUPS:
+"""]
+    # One groupby pass instead of a boolean mask per group
+    lines.extend(
+        f"- Link {grp}: Cells {cells.tolist()}\n"
+        for grp, cells in groups_df.groupby("relative_group", sort=True)["cell_id"]
+    )
+    return "".join(lines)
+
+
 # ============================================================
 # Endpoints
 # ============================================================
+# Endpoints return frontend_service output (and the expand-detail cache)
+# as-is: it already has the response-model shape, so it is rendered straight
+# to JSON with orjson instead of being re-validated into the model
+# (response_model stays for the OpenAPI schema only).
 
 @router.get("/similarity-matrix", response_model=SimilarityMatrixResponse)
 async def get_similarity_matrix():
@@ -97,7 +279,40 @@ async def get_similarity_matrix():
     """
     try:
         data = frontend_service.get_similarity_matrix()
-        return SimilarityMatrixResponse(**data)
+        return ORJSONResponse(data)
+    except FileNotFoundError as e:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Similarity matrix not found: {e}"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get similarity matrix: {e}"
+        )
+
+
+@router.get("/similarity-matrix.bin")
+async def get_similarity_matrix_binary():
+    """
+    Returns the cell similarity matrix as raw float32 (row-major,
+    little-endian), a fraction of the JSON size for large matrices.
+    
+    Shape and dtype are in the X-Matrix-Shape ("n,n") and X-Matrix-Dtype
+    headers; read with new Float32Array(await res.arrayBuffer()). Rows and
+    columns follow the cellIds of /similarity-matrix (the ids would outgrow
+    header size limits on large matrices).
+    """
+    try:
+        data = frontend_service.get_similarity_matrix_binary()
+        return Response(
+            data["data"],
+            media_type="application/octet-stream",
+            headers={
+                "X-Matrix-Shape": ",".join(map(str, data["shape"])),
+                "X-Matrix-Dtype": "float32",
+            },
+        )
     except FileNotFoundError as e:
         raise HTTPException(
             status_code=404,
@@ -119,7 +334,7 @@ async def get_cells():
     """
     try:
         data = frontend_service.get_cells()
-        return CellsResponse(**data)
+        return ORJSONResponse(data)
     except FileNotFoundError as e:
         raise HTTPException(
             status_code=404, 
@@ -141,7 +356,7 @@ async def get_topology_groups():
     """
     try:
         data = frontend_service.get_topology_groups()
-        return TopologyGroupsResponse(**data)
+        return ORJSONResponse(data)
     except FileNotFoundError as e:
         raise HTTPException(
             status_code=404,
@@ -163,7 +378,7 @@ async def get_propagation_events():
     """
     try:
         data = frontend_service.get_propagation_events()
-        return PropagationResponse(**data)
+        return ORJSONResponse(data)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -180,7 +395,7 @@ async def get_insights():
     """
     try:
         data = frontend_service.get_insights()
-        return InsightsResponse(**data)
+        return ORJSONResponse(data)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -208,7 +423,7 @@ async def get_recommendations():
     """
     try:
         data = frontend_service.get_recommendations()
-        return RecommendationsResponse(**data)
+        return ORJSONResponse(data)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -232,45 +447,91 @@ class RecommendationExpandResponse(BaseModel):
     priority: str
 
 
-# Cache for expanded recommendations
-_rec_detail_cache: Dict[str, Dict] = {}
+# In-flight LLM generations by key: concurrent identical requests await the
+# first caller's result instead of each hitting the model (cache stampede)
+_inflight: Dict[str, "asyncio.Future[Any]"] = {}
 
 
-@router.post("/recommendation-expand", response_model=RecommendationExpandResponse)
-async def expand_recommendation(request: RecommendationExpandRequest):
-    """
-    Get detailed LLM-generated content for a recommendation.
-    Cached for 1 hour per recommendation.
+async def _single_flight(key: str, make: Callable[[], Awaitable[Any]]) -> Any:
+    """Run make() once per key at a time; concurrent callers share its outcome."""
+    future = _inflight.get(key)
+    if future is not None:
+        return await asyncio.shield(future)
+    
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await make()
+    except BaseException as exc:
+        # A cancelled leader (client went away) must not cancel the waiters
+        if isinstance(exc, asyncio.CancelledError):
+            exc = RuntimeError(f"{key}: generation was cancelled")
+        future.set_exception(exc)
+        future.exception()  # mark retrieved: nobody may be waiting
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        del _inflight[key]
+
+
+# Cache for expanded recommendations: LRU-bounded, entries go stale after an
+# hour but are kept as the answer of last resort while the LLM is down
+_REC_DETAIL_TTL = 3600  # 1 hour
+_REC_DETAIL_MAX_ENTRIES = 512
+# Details are stored pre-encoded, so a hit is a lookup plus a byte copy
+_rec_detail_cache: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()  # key -> (expires_at, JSON body)
+
+# Section headers of the expand prompt's reply format, and "- " step bullets
+_LLM_SECTION = re.compile(r"^[ \t]*(DESCRIPTION|STEPS|IMPACT|PRIORITY):(.*)$", re.MULTILINE)
+_LLM_STEP = re.compile(r"^[ \t]*-(.*)$", re.MULTILINE)
+
+
+def _parse_recommendation_detail(llm_text: str) -> Dict[str, Any]:
     """
-    cache_key = f"rec_{request.rec_id}"
+    Split an expand reply into description, steps, impact and priority.
     
-    # Check cache
-    if cache_key in _rec_detail_cache:
-        return RecommendationExpandResponse(**_rec_detail_cache[cache_key])
+    Each header's text runs to the next header; non-empty continuation
+    lines of DESCRIPTION/IMPACT are joined with spaces, and STEPS keeps
+    only "-" bullets. Missing sections keep their defaults.
+    """
+    parsed: Dict[str, Any] = {
+        "description": "",
+        "steps": [],
+        "impact": "Improved network stability",
+        "priority": "MEDIUM",
+    }
     
-    try:
-        from app.providers.ollama import OllamaProvider
-        from app.providers.base import ChatMessage
-        import pandas as pd
-        from pathlib import Path
-        
-        # Load network context
-        PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent.parent
-        anomaly_path = PROJECT_ROOT / "ML" / "outputs" / "cell_anomalies.csv"
-        
-        context = ""
-        if anomaly_path.exists():
-            df = pd.read_csv(anomaly_path)
-            cell_stats = df.groupby("cell_id").agg({"anomaly": "mean"}).reset_index()
-            top_anomalies = cell_stats.nlargest(3, "anomaly")
-            context = f"Top anomalies: {', '.join([f'Cell {int(r.cell_id)} ({r.anomaly*100:.0f}%)' for _, r in top_anomalies.iterrows()])}"
+    headers = list(_LLM_SECTION.finditer(llm_text))
+    for i, header in enumerate(headers):
+        section = header.group(1)
+        first_line = header.group(2).strip()
+        body = llm_text[header.end():headers[i + 1].start() if i + 1 < len(headers) else len(llm_text)]
         
-        provider = OllamaProvider()
-        
-        messages = [
-            ChatMessage(
-                role="system",
-                content="""You are a network operations advisor. For the given recommendation, provide:
+        if section == "STEPS":
+            parsed["steps"].extend(step.strip() for step in _LLM_STEP.findall(body))
+        elif section == "PRIORITY":
+            parsed["priority"] = first_line
+        else:
+            continuation = [line.strip() for line in body.splitlines() if line.strip()]
+            key = "description" if section == "DESCRIPTION" else "impact"
+            parsed[key] = " ".join([first_line, *continuation])
+    
+    return parsed
+
+
+async def _generate_recommendation_detail(request: RecommendationExpandRequest, cache_key: str) -> bytes:
+    """Ask the LLM to expand a recommendation; caches and returns the JSON body."""
+    # Load network context (file I/O off the event loop)
+    context = await asyncio.to_thread(_top_anomalies_context)
+    
+    provider = get_provider("ollama")
+    
+    messages = [
+        ChatMessage(
+            role="system",
+            content="""You are a network operations advisor. For the given recommendation, provide:
 1. A detailed description (2-3 sentences)
 2. 3-4 actionable steps to implement
 3. Expected impact
@@ -284,63 +545,73 @@ STEPS:
 - Step 3
 IMPACT: [expected impact]
 PRIORITY: [HIGH/MEDIUM/LOW]"""
-            ),
-            ChatMessage(
-                role="user",
-                content=f"Recommendation: {request.title} (Type: {request.type})\nNetwork context: {context}"
-            ),
-        ]
-        
-        result = await provider.chat(messages)
-        llm_text = result.content
-        
-        # Parse response
-        description = ""
-        steps = []
-        impact = "Improved network stability"
-        priority = "MEDIUM"
-        
-        lines = llm_text.split('\n')
-        current_section = ""
-        for line in lines:
-            line = line.strip()
-            if line.startswith("DESCRIPTION:"):
-                current_section = "desc"
-                description = line.replace("DESCRIPTION:", "").strip()
-            elif line.startswith("STEPS:"):
-                current_section = "steps"
-            elif line.startswith("IMPACT:"):
-                current_section = "impact"
-                impact = line.replace("IMPACT:", "").strip()
-            elif line.startswith("PRIORITY:"):
-                priority = line.replace("PRIORITY:", "").strip()
-            elif current_section == "desc" and line:
-                description += " " + line
-            elif current_section == "steps" and line.startswith("-"):
-                steps.append(line[1:].strip())
-            elif current_section == "impact" and line:
-                impact += " " + line
-        
-        # Fallback if parsing fails
-        if not description:
-            description = f"Detailed analysis for: {request.title}"
-        if not steps:
-            steps = ["Review affected cells", "Check network logs", "Apply remediation"]
-        
-        detail = {
-            "rec_id": request.rec_id,
-            "title": request.title,
-            "type": request.type,
-            "detailed_description": description[:300],
-            "steps": steps[:5],
-            "impact": impact[:150],
-            "priority": priority
-        }
-        
-        _rec_detail_cache[cache_key] = detail
-        return RecommendationExpandResponse(**detail)
+        ),
+        ChatMessage(
+            role="user",
+            content=f"Recommendation: {request.title} (Type: {request.type})\nNetwork context: {context}"
+        ),
+    ]
+    
+    result = await provider.chat(messages)
+    llm_text = result.content
+    
+    # Parse response
+    parsed = _parse_recommendation_detail(llm_text)
+    description = parsed["description"]
+    steps = parsed["steps"]
+    impact = parsed["impact"]
+    priority = parsed["priority"]
+    
+    # Fallback if parsing fails
+    if not description:
+        description = f"Detailed analysis for: {request.title}"
+    if not steps:
+        steps = ["Review affected cells", "Check network logs", "Apply remediation"]
+    
+    detail = {
+        "rec_id": request.rec_id,
+        "title": request.title,
+        "type": request.type,
+        "detailed_description": description[:300],
+        "steps": steps[:5],
+        "impact": impact[:150],
+        "priority": priority
+    }
+    
+    body = orjson_dumps(detail)
+    _rec_detail_cache[cache_key] = (time.monotonic() + _REC_DETAIL_TTL, body)
+    _rec_detail_cache.move_to_end(cache_key)
+    while len(_rec_detail_cache) > _REC_DETAIL_MAX_ENTRIES:
+        _rec_detail_cache.popitem(last=False)
+    return body
+
+
+@router.post("/recommendation-expand", response_model=RecommendationExpandResponse)
+async def expand_recommendation(request: RecommendationExpandRequest):
+    """
+    Get detailed LLM-generated content for a recommendation.
+    Cached for 1 hour per recommendation.
+    """
+    cache_key = f"rec_{request.rec_id}"
+    
+    # Check cache
+    cached = _rec_detail_cache.get(cache_key)
+    if cached is not None:
+        _rec_detail_cache.move_to_end(cache_key)
+        expires_at, body = cached
+        if time.monotonic() < expires_at:
+            return Response(body, media_type="application/json")
+    
+    try:
+        # Concurrent expands of the same recommendation share one LLM call
+        body = await _single_flight(cache_key, lambda: _generate_recommendation_detail(request, cache_key))
+        return Response(body, media_type="application/json")
         
     except Exception as e:
+        # Stale detail beats the generic fallback
+        if cached is not None:
+            return Response(cached[1], media_type="application/json")
+        
         # Fallback response
         return RecommendationExpandResponse(
             rec_id=request.rec_id,
@@ -360,11 +631,11 @@ async def generate_insights():
     Results are cached for 1 hour to reduce GPU load.
     """
     try:
-        data = await frontend_service.get_insights_llm()
-        return data
+        body = await _single_flight("insights_llm", frontend_service.get_insights_llm_json)
+        return Response(body, media_type="application/json")
     except Exception as e:
         # Return default insights if LLM fails
-        return frontend_service.get_insights()
+        return ORJSONResponse(frontend_service.get_insights())
 
 
 @router.post("/generate-recommendations")
@@ -374,10 +645,10 @@ async def generate_recommendations():
     Results are cached for 1 hour to reduce GPU load.
     """
     try:
-        data = await frontend_service.get_recommendations_llm()
-        return data
+        body = await _single_flight("recommendations_llm", frontend_service.get_recommendations_llm_json)
+        return Response(body, media_type="application/json")
     except Exception as e:
-        return frontend_service.get_recommendations()
+        return ORJSONResponse(frontend_service.get_recommendations())
 
 
 @router.post("/chat", response_model=ChatResponse)
@@ -388,65 +659,12 @@ async def chat(request: ChatRequest):
     Used by: FloatingChatbot component
     """
     try:
-        from app.services.copilot_service import copilot_service
-        import pandas as pd
-        from pathlib import Path
-        
-        # Build rich context from actual data
-        PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent.parent
-        
-        # Load anomaly data
-        anomaly_path = PROJECT_ROOT / "ML" / "outputs" / "cell_anomalies.csv"
-        anomaly_context = ""
-        if anomaly_path.exists():
-            df = pd.read_csv(anomaly_path)
-            cell_stats = df.groupby("cell_id").agg({
-                "anomaly": "mean",
-                "confidence": "mean"
-            }).reset_index()
-            
-            # Identify anomalous cells (>25% rate)
-            anomalous = cell_stats[cell_stats["anomaly"] > 0.25]
-            healthy = cell_stats[cell_stats["anomaly"] <= 0.25]
-            
-            anomaly_context = f"""
-ANOMALY DETECTION RESULTS:
-- Total cells monitored: {len(cell_stats)}
-- Anomalous cells (>25% throughput drop rate): {len(anomalous)}
-- Healthy cells: {len(healthy)}
-- Threshold: 30% throughput drop from rolling median baseline
-
-ANOMALOUS CELLS DETAIL:
-"""
-            for _, row in anomalous.iterrows():
-                anomaly_context += f"- Cell {int(row['cell_id'])}: {row['anomaly']*100:.1f}% of time slots show anomaly, avg confidence {row['confidence']*100:.1f}%\n"
-            
-            if len(anomalous) == 0:
-                anomaly_context += "- No cells currently exceed the 25% anomaly rate threshold\n"
-            
-            anomaly_context += f"""
-TOP 5 CELLS BY ANOMALY RATE:
-"""
-            for _, row in cell_stats.nlargest(5, "anomaly").iterrows():
-                status = "⚠️ FLAGGED" if row["anomaly"] > 0.25 else "✓ healthy"
-                anomaly_context += f"- Cell {int(row['cell_id'])}: {row['anomaly']*100:.1f}% rate ({status})\n"
-        
-        # Load topology groups
-        groups_path = PROJECT_ROOT / "Clustering" / "outputs" / "relative_fronthaul_groups.csv"
-        topology_context = ""
-        if groups_path.exists():
-            groups_df = pd.read_csv(groups_path)
-            n_groups = groups_df["relative_group"].nunique()
-            topology_context = f"""
-TOPOLOGY CLUSTERING:
-- {n_groups} distinct fronthaul link groups identified
-- Cells in same group share similar congestion patterns (likely shared infrastructure)
-
-GROUPS:
-"""
-            for grp in sorted(groups_df["relative_group"].unique()):
-                cells = groups_df[groups_df["relative_group"] == grp]["cell_id"].tolist()
-                topology_context += f"- Link {grp}: Cells {cells}\n"
+        # Build rich context from actual data (file I/O off the event loop,
+        # both files loaded concurrently)
+        anomaly_context, topology_context = await asyncio.gather(
+            asyncio.to_thread(_anomaly_context),
+            asyncio.to_thread(_topology_context),
+        )
         
         # ML Pipeline context
         ml_context = """
@@ -497,7 +715,7 @@ async def get_complete_state():
     Useful for initial page load.
     """
     try:
-        return frontend_service.get_complete_state()
+        return Response(frontend_service.get_complete_state_json(), media_type="application/json")
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -512,5 +730,8 @@ async def refresh_cache():
     Call this after uploading new data or running analysis.
     """
     frontend_service.clear_cache()
+    _stat_cache.clear()
+    for cached in (_load_cell_stats, _render_top_anomalies, _render_anomaly_context, _render_topology_context):
+        cached.cache_clear()
     return {"status": "ok", "message": "Cache cleared"}
 
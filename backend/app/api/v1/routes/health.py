@@ -3,9 +3,11 @@
 Health and monitoring API endpoints.
 """
 
+import time
 from datetime import datetime, timezone
+from typing import Optional, Tuple
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 from app.api.v1.schemas import (
     ServiceStatus,
@@ -13,33 +15,59 @@ from app.api.v1.schemas import (
     MetricsResponse,
 )
 from app.services.storage import storage
-from app.providers.ollama import OllamaProvider
+from app.providers.registry import get_provider
 
 router = APIRouter()
 
+# Health/metrics are polled often and barely change. The health check's
+# Ollama probe is a network round trip, so its result and the body encoded
+# from it are kept for a second (the timestamp is the time of that check)
+_BODY_TTL = 1.0
+_health_cache: Optional[Tuple[float, bytes]] = None
+_metrics_cache: Optional[Tuple[float, bytes]] = None
 
-@router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
-    """
-    System health check.
-    
-    Returns status of all services.
-    """
-    # Check LLM availability
+
+async def _llm_status() -> str:
+    """Probe the shared Ollama provider: healthy, degraded or unavailable."""
     try:
-        provider = OllamaProvider()
+        provider = get_provider("ollama")  # shared instance, not one per poll
         llm_health = await provider.health_check()
-        llm_status = "healthy" if llm_health.is_healthy else "degraded"
+        return "healthy" if llm_health.is_healthy else "degraded"
     except:
-        llm_status = "unavailable"
-    
-    services = ServiceStatus(
+        return "unavailable"
+
+
+def _health_bytes(overall_status: str, llm_status: str, version: str) -> bytes:
+    """Encoded HealthResponse for one health check."""
+    services = ServiceStatus.model_construct(
         data_ingestion="healthy",
         similarity_engine="healthy",
         clustering_engine="healthy",
         ml_analytics="healthy",
         llm_copilot=llm_status,
     )
+    return HealthResponse.model_construct(
+        status=overall_status,
+        timestamp=datetime.now(timezone.utc),
+        services=services,
+        version=version,
+    ).to_json_bytes()
+
+
+@router.get("/health", response_model=HealthResponse)
+async def health_check() -> Response:
+    """
+    System health check.
+    
+    Returns status of all services (checked at most once a second).
+    """
+    global _health_cache
+    now = time.monotonic()
+    if _health_cache is not None and now - _health_cache[0] < _BODY_TTL:
+        return Response(_health_cache[1], media_type="application/json")
+    
+    # Check LLM availability
+    llm_status = await _llm_status()
     
     # Determine overall status
     if llm_status == "unavailable":
@@ -47,24 +75,26 @@ async def health_check() -> HealthResponse:
     else:
         overall_status = "healthy"
     
-    return HealthResponse(
-        status=overall_status,
-        timestamp=datetime.now(timezone.utc).isoformat(),
-        services=services,
-        version="1.0.0",
-    )
+    body = _health_bytes(overall_status, llm_status, version="1.0.0")
+    _health_cache = (now, body)
+    return Response(body, media_type="application/json")
 
 
 @router.get("/metrics", response_model=MetricsResponse)
-async def get_metrics() -> MetricsResponse:
+async def get_metrics() -> Response:
     """
     System performance metrics.
     
-    Returns current system statistics.
+    Returns current system statistics (cached for up to a second).
     """
+    global _metrics_cache
+    now = time.monotonic()
+    if _metrics_cache is not None and now - _metrics_cache[0] < _BODY_TTL:
+        return Response(_metrics_cache[1], media_type="application/json")
+    
     metrics = storage.get_metrics()
     
-    return MetricsResponse(
+    body = MetricsResponse.model_construct(
         requests_per_minute=0,  # Would need request tracking middleware
         avg_response_time_ms=0,  # Would need timing middleware
         active_jobs=metrics.get("active_jobs", 0),
@@ -77,4 +107,6 @@ async def get_metrics() -> MetricsResponse:
         anomalies_count=metrics.get("anomalies_count", 0),
         propagations_count=metrics.get("propagations_count", 0),
         reports_count=metrics.get("reports_count", 0),
-    )
+    ).to_json_bytes()
+    _metrics_cache = (now, body)
+    return Response(body, media_type="application/json")
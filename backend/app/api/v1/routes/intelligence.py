@@ -3,7 +3,7 @@
 Intelligence layer API endpoints.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
 from app.api.v1.schemas import (
     DetectAnomaliesRequest,
@@ -41,14 +41,15 @@ async def detect_anomalies(request: DetectAnomaliesRequest) -> DetectAnomaliesRe
 
 
 @router.get("/anomalies/{analysis_id}", response_model=AnomalyResult)
-async def get_anomalies(analysis_id: str) -> AnomalyResult:
+async def get_anomalies(analysis_id: str) -> Response:
     """
     Retrieve anomaly detection results.
     """
     result = anomaly_service.get_anomaly(analysis_id)
     if not result:
         raise HTTPException(status_code=404, detail=f"Anomaly analysis not found: {analysis_id}")
-    return AnomalyResult(**result)
+    anomalies = AnomalyResult.from_trusted(**result)
+    return Response(anomalies.to_json_bytes(), media_type="application/json")
 
 
 @router.post("/analyze-propagation", response_model=AnalyzePropagationResponse)
@@ -74,11 +75,12 @@ async def analyze_propagation(request: AnalyzePropagationRequest) -> AnalyzeProp
 
 
 @router.get("/propagation/{propagation_id}", response_model=PropagationResult)
-async def get_propagation(propagation_id: str) -> PropagationResult:
+async def get_propagation(propagation_id: str) -> Response:
     """
     Retrieve propagation analysis results.
     """
     result = propagation_service.get_propagation(propagation_id)
     if not result:
         raise HTTPException(status_code=404, detail=f"Propagation analysis not found: {propagation_id}")
-    return PropagationResult(**result)
+    propagation = PropagationResult.from_trusted(**result)
+    return Response(propagation.to_json_bytes(), media_type="application/json")
@@ -3,7 +3,7 @@
 Topology layer API endpoints.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
 from app.api.v1.schemas import (
     ComputeSimilarityRequest,
@@ -41,14 +41,36 @@ async def compute_similarity(request: ComputeSimilarityRequest) -> ComputeSimila
 
 
 @router.get("/similarity/{similarity_id}", response_model=SimilarityMatrix)
-async def get_similarity(similarity_id: str) -> SimilarityMatrix:
+async def get_similarity(similarity_id: str) -> Response:
     """
     Retrieve computed similarity matrix.
     """
     result = similarity_service.get_similarity(similarity_id)
     if not result:
         raise HTTPException(status_code=404, detail=f"Similarity matrix not found: {similarity_id}")
-    return SimilarityMatrix(**result)
+    similarity = SimilarityMatrix.from_trusted(**result)
+    return Response(similarity.to_json_bytes(), media_type="application/json")
+
+
+@router.get("/similarity/{similarity_id}/raw")
+async def get_similarity_raw(similarity_id: str) -> Response:
+    """
+    Retrieve similarity matrix as raw bytes.
+    
+    Body is the matrix as little-endian float32, row-major; the shape
+    ("n,n") and dtype are in the X-Matrix-Shape and X-Matrix-Dtype
+    headers, as for /similarity-matrix.bin. Rows and columns follow the
+    JSON cell_ids.
+    """
+    matrix = similarity_service.get_similarity_raw(similarity_id)
+    if matrix is None:
+        raise HTTPException(status_code=404, detail=f"Similarity matrix not found: {similarity_id}")
+    rows, cols = matrix.shape
+    return Response(
+        matrix.tobytes(),
+        media_type="application/octet-stream",
+        headers={"X-Matrix-Shape": f"{rows},{cols}", "X-Matrix-Dtype": "float32"},
+    )
 
 
 @router.post("/infer", response_model=InferTopologyResponse)
@@ -73,11 +95,12 @@ async def infer_topology(request: InferTopologyRequest) -> InferTopologyResponse
 
 
 @router.get("/result/{topology_id}", response_model=TopologyResult)
-async def get_topology(topology_id: str) -> TopologyResult:
+async def get_topology(topology_id: str) -> Response:
     """
     Retrieve topology inference result.
     """
     result = topology_service.get_topology(topology_id)
     if not result:
         raise HTTPException(status_code=404, detail=f"Topology not found: {topology_id}")
-    return TopologyResult(**result)
+    topology = TopologyResult.from_trusted(**result)
+    return Response(topology.to_json_bytes(), media_type="application/json")
@@ -2,154 +2,117 @@
 """
 API v1 schemas package.
 
-Export all schemas for convenient importing.
+Export all schemas for convenient importing. Submodules are imported
+lazily on first attribute access (PEP 562), so only the schema modules
+actually used pay for building their models.
 """
 
-from .common import (
-    ErrorDetail,
-    ErrorResponse,
-    MetadataResponse,
-    APIResponse,
-    PaginationParams,
-    PaginatedResponse,
-)
+import importlib
+from typing import Any, List
 
-from .data import (
-    DataMetadata,
-    DataUploadRequest,
-    DataUploadResponse,
-    LossEventRecord,
-    ThroughputRecord,
-)
+from pydantic import BaseModel
 
-from .topology import (
-    ComputeSimilarityRequest,
-    ComputeSimilarityResponse,
-    SimilarityMatrix,
-    InferTopologyRequest,
-    InferTopologyResponse,
-    LinkGroup,
-    CellAssignment,
-    TopologyResult,
-)
-
-from .intelligence import (
-    DetectAnomaliesRequest,
-    DetectAnomaliesResponse,
-    AnomalyScore,
-    AnomalyStatistics,
-    AnomalyResult,
-    AnalyzePropagationRequest,
-    AnalyzePropagationResponse,
-    PropagationEvent,
-    PropagationPath,
-    NetworkNode,
-    NetworkEdge,
-    NetworkGraph,
-    PropagationResult,
-)
-
-from .copilot import (
-    InsightContext,
-    GenerateInsightsRequest,
-    GenerateInsightsResponse,
-    NetworkInsight,
-    ActionRecommendation,
-    TopologySummary,
-    ReportMetadata,
-    CopilotReport,
-    QueryContext,
-    QueryRequest,
-    SupportingData,
-    QueryResponse,
-)
-
-from .visualization import (
-    HeatmapRequest,
-    TopologyGraphRequest,
-    PropagationFlowRequest,
-    VisualizationResponse,
-)
-
-from .batch import (
-    BatchConfig,
-    BatchAnalysisRequest,
-    BatchStep,
-    BatchResults,
-    BatchAnalysisResponse,
-    BatchStatusResponse,
-)
-
-from .health import (
-    ServiceStatus,
-    HealthResponse,
-    MetricsResponse,
-)
-
-__all__ = [
+# Exported name -> submodule that defines it
+_LAZY = {
     # Common
-    "ErrorDetail",
-    "ErrorResponse",
-    "MetadataResponse",
-    "APIResponse",
-    "PaginationParams",
-    "PaginatedResponse",
+    "BaseSchema": "common",
+    "ResponseBase": "common",
+    "ErrorDetail": "common",
+    "ErrorResponse": "common",
+    "MetadataResponse": "common",
+    "APIResponse": "common",
+    "PaginationParams": "common",
+    "PaginatedResponse": "common",
     # Data
-    "DataMetadata",
-    "DataUploadRequest",
-    "DataUploadResponse",
-    "LossEventRecord",
-    "ThroughputRecord",
+    "DataMetadata": "data",
+    "LossEventBatch": "data",
+    "DataUploadRequest": "data",
+    "DataUploadResponse": "data",
+    "LossEventRecord": "data",
+    "ThroughputRecord": "data",
+    "LOSS_EVENTS_ADAPTER": "data",
+    "THROUGHPUT_ADAPTER": "data",
+    "METADATA_ADAPTER": "data",
     # Topology
-    "ComputeSimilarityRequest",
-    "ComputeSimilarityResponse",
-    "SimilarityMatrix",
-    "InferTopologyRequest",
-    "InferTopologyResponse",
-    "LinkGroup",
-    "CellAssignment",
-    "TopologyResult",
+    "ComputeSimilarityRequest": "topology",
+    "ComputeSimilarityResponse": "topology",
+    "SimilarityMatrix": "topology",
+    "InferTopologyRequest": "topology",
+    "InferTopologyResponse": "topology",
+    "LinkGroup": "topology",
+    "CellAssignment": "topology",
+    "TopologyResult": "topology",
     # Intelligence
-    "DetectAnomaliesRequest",
-    "DetectAnomaliesResponse",
-    "AnomalyScore",
-    "AnomalyStatistics",
-    "AnomalyResult",
-    "AnalyzePropagationRequest",
-    "AnalyzePropagationResponse",
-    "PropagationEvent",
-    "PropagationPath",
-    "NetworkNode",
-    "NetworkEdge",
-    "NetworkGraph",
-    "PropagationResult",
+    "DetectAnomaliesRequest": "intelligence",
+    "DetectAnomaliesResponse": "intelligence",
+    "AnomalyScore": "intelligence",
+    "AnomalyStatistics": "intelligence",
+    "AnomalyResult": "intelligence",
+    "AnalyzePropagationRequest": "intelligence",
+    "AnalyzePropagationResponse": "intelligence",
+    "PropagationEvent": "intelligence",
+    "PropagationPath": "intelligence",
+    "NetworkNode": "intelligence",
+    "NetworkEdge": "intelligence",
+    "NetworkGraph": "intelligence",
+    "PropagationResult": "intelligence",
     # Copilot
-    "InsightContext",
-    "GenerateInsightsRequest",
-    "GenerateInsightsResponse",
-    "NetworkInsight",
-    "ActionRecommendation",
-    "TopologySummary",
-    "ReportMetadata",
-    "CopilotReport",
-    "QueryContext",
-    "QueryRequest",
-    "SupportingData",
-    "QueryResponse",
+    "InsightContext": "copilot",
+    "GenerateInsightsRequest": "copilot",
+    "GenerateInsightsResponse": "copilot",
+    "NetworkInsight": "copilot",
+    "ActionRecommendation": "copilot",
+    "TopologySummary": "copilot",
+    "ReportMetadata": "copilot",
+    "CopilotReport": "copilot",
+    "QueryContext": "copilot",
+    "QueryRequest": "copilot",
+    "SupportingData": "copilot",
+    "QueryResponse": "copilot",
     # Visualization
-    "HeatmapRequest",
-    "TopologyGraphRequest",
-    "PropagationFlowRequest",
-    "VisualizationResponse",
+    "HeatmapRequest": "visualization",
+    "TopologyGraphRequest": "visualization",
+    "PropagationFlowRequest": "visualization",
+    "VisualizationResponse": "visualization",
     # Batch
-    "BatchConfig",
-    "BatchAnalysisRequest",
-    "BatchStep",
-    "BatchResults",
-    "BatchAnalysisResponse",
-    "BatchStatusResponse",
+    "BatchConfig": "batch",
+    "BatchAnalysisRequest": "batch",
+    "BatchStep": "batch",
+    "BatchResults": "batch",
+    "BatchAnalysisResponse": "batch",
+    "BatchStatusResponse": "batch",
     # Health
-    "ServiceStatus",
-    "HealthResponse",
-    "MetricsResponse",
-]
+    "ServiceStatus": "health",
+    "HealthResponse": "health",
+    "MetricsResponse": "health",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    obj = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+def build_schemas() -> None:
+    """
+    Finish every deferred model build now (call once at startup).
+    
+    Models are declared with defer_build, and FastAPI validates through
+    its own adapters, so a model's validator and serializer are otherwise
+    built by the first request that constructs or encodes it.
+    """
+    for name in __all__:
+        obj = __getattr__(name)
+        if isinstance(obj, type) and issubclass(obj, BaseModel) and not obj.__pydantic_complete__:
+            obj.model_rebuild()
@@ -5,12 +5,18 @@ Batch processing schemas.
 Schemas for running complete analysis pipelines.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .common import BaseSchema, IsoDatetime, ResponseBase
 
-class BatchConfig(BaseModel):
+
+# Lifecycle of a batch job and of each of its steps
+JobStatus = Literal["pending", "processing", "completed", "failed"]
+
+
+class BatchConfig(BaseSchema):
     """Configuration for batch analysis."""
     
     similarity_method: str = Field(
@@ -47,7 +53,7 @@ class BatchConfig(BaseModel):
     )
 
 
-class BatchAnalysisRequest(BaseModel):
+class BatchAnalysisRequest(BaseSchema):
     """Request for full analysis pipeline."""
     
     upload_id: str = Field(
@@ -61,7 +67,7 @@ class BatchAnalysisRequest(BaseModel):
     )
 
 
-class BatchStep(BaseModel):
+class BatchStep(ResponseBase):
     """Status of a single batch step."""
     
     step: str = Field(
@@ -69,7 +75,7 @@ class BatchStep(BaseModel):
         description="Step name",
         examples=["similarity_computation"],
     )
-    status: str = Field(
+    status: JobStatus = Field(
         ...,
         description="Status: pending, processing, completed, failed",
         examples=["completed"],
@@ -84,18 +90,18 @@ class BatchStep(BaseModel):
     )
 
 
-class BatchResults(BaseModel):
+class BatchResults(ResponseBase):
     """Results from completed batch analysis."""
     
-    topology_id: Optional[str] = Field(default=None)
-    similarity_id: Optional[str] = Field(default=None)
-    anomaly_id: Optional[str] = Field(default=None)
-    propagation_id: Optional[str] = Field(default=None)
-    report_id: Optional[str] = Field(default=None)
+    topology_id: Optional[str] = None
+    similarity_id: Optional[str] = None
+    anomaly_id: Optional[str] = None
+    propagation_id: Optional[str] = None
+    report_id: Optional[str] = None
     visualizations: List[str] = Field(default_factory=list)
 
 
-class BatchAnalysisResponse(BaseModel):
+class BatchAnalysisResponse(ResponseBase):
     """Response from batch analysis initiation."""
     
     batch_id: str = Field(
@@ -103,7 +109,7 @@ class BatchAnalysisResponse(BaseModel):
         description="Unique batch job identifier",
         examples=["batch_001"],
     )
-    status: str = Field(
+    status: JobStatus = Field(
         ...,
         description="Overall status",
         examples=["processing"],
@@ -124,7 +130,7 @@ class BatchAnalysisResponse(BaseModel):
     )
 
 
-class BatchStatusResponse(BaseModel):
+class BatchStatusResponse(ResponseBase):
     """Response for batch status check."""
     
     batch_id: str = Field(
@@ -132,17 +138,17 @@ class BatchStatusResponse(BaseModel):
         description="Batch job identifier",
         examples=["batch_001"],
     )
-    status: str = Field(
+    status: JobStatus = Field(
         ...,
         description="Overall status: pending, processing, completed, failed",
         examples=["completed"],
     )
-    started_at: str = Field(
+    started_at: IsoDatetime = Field(
         ...,
         description="Start timestamp (ISO 8601)",
         examples=["2026-01-31T10:30:00Z"],
     )
-    completed_at: Optional[str] = Field(
+    completed_at: Optional[IsoDatetime] = Field(
         default=None,
         description="Completion timestamp (if completed)",
         examples=["2026-01-31T10:52:00Z"],
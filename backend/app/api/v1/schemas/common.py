@@ -5,17 +5,147 @@ Common schemas used across all API endpoints.
 These schemas provide consistent response structures and error formats.
 """
 
-from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+import time
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Annotated, Any, Dict, Generic, List, Literal, Optional, TypeVar, Union, get_args
 
-from pydantic import BaseModel, Field
+from annotated_types import Ge, Le
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, computed_field
+from typing_extensions import NotRequired, TypedDict
 
 
 # Generic type for response data
 T = TypeVar("T")
 
 
-class ErrorDetail(BaseModel):
+def _iso_z(value: Union[datetime, str]) -> str:
+    """
+    ISO 8601 text for a timestamp field.
+    
+    Aware datetimes keep their offset (matching the services'
+    isoformat() strings); naive ones are taken as UTC and get a 'Z'.
+    Strings left in place by from_trusted() are already ISO 8601.
+    """
+    if isinstance(value, str):
+        return value
+    if value.tzinfo is None:
+        return value.isoformat() + "Z"
+    return value.isoformat()
+
+
+# Coarse clock for response timestamps: one datetime is reused for up to
+# 10 ms instead of building a new one for every response
+_CLOCK_RESOLUTION_NS = 10_000_000
+_clock_ns = 0
+_clock_value = datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _coarse_utcnow() -> datetime:
+    """Naive UTC now (like the deprecated datetime.utcnow), at 10 ms resolution."""
+    global _clock_ns, _clock_value
+    now_ns = time.monotonic_ns()
+    if now_ns - _clock_ns >= _CLOCK_RESOLUTION_NS:
+        _clock_value = datetime.now(timezone.utc).replace(tzinfo=None)
+        _clock_ns = now_ns
+    return _clock_value
+
+
+# Timestamp parsed and validated by pydantic-core, emitted as ISO 8601 text
+IsoDatetime = Annotated[datetime, PlainSerializer(_iso_z, return_type=str, when_used="json")]
+
+
+# Constrained numbers; constraints live in the annotation, no Field() needed
+NonNegInt = Annotated[int, Ge(0)]
+NonNegFloat = Annotated[float, Ge(0)]
+PosInt = Annotated[int, Ge(1)]
+PageSize = Annotated[int, Ge(1), Le(100)]
+
+
+def _schema_type(annotation: Any) -> Optional[type]:
+    """Return the BaseSchema subclass inside X, Optional[X] or List[X]."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseSchema):
+        return annotation
+    for arg in get_args(annotation):
+        schema = _schema_type(arg)
+        if schema is not None:
+            return schema
+    return None
+
+
+class BaseSchema(BaseModel):
+    """
+    Base for all API v1 schemas.
+    
+    Request models keep pydantic's default config; response models
+    derive from ResponseBase. For responses made from trusted server-side
+    data, use from_trusted() instead of the validating constructor and
+    to_json_bytes() to encode straight to a response body.
+    """
+    
+    @classmethod
+    def from_trusted(cls, **kwargs: Any):
+        """
+        Build an instance without running validation.
+        
+        Wraps model_construct(); nested dicts (and lists of dicts) for
+        BaseSchema-typed fields are constructed the same way, so no child
+        validator fires either. Only pass data the server produced itself.
+        """
+        values = {}
+        for name, field in cls.model_fields.items():
+            if name not in kwargs:
+                continue
+            value = kwargs[name]
+            schema = _schema_type(field.annotation)
+            if schema is not None:
+                if isinstance(value, dict):
+                    value = schema.from_trusted(**value)
+                elif isinstance(value, list):
+                    value = [
+                        schema.from_trusted(**item) if isinstance(item, dict) else item
+                        for item in value
+                    ]
+            values[name] = value
+        
+        # model_construct records the given keys as __pydantic_fields_set__
+        return cls.model_construct(**values)
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON in pydantic-core, without a dict round trip."""
+        return self.__pydantic_serializer__.to_json(self)
+
+
+class ResponseBase(BaseSchema):
+    """
+    Base for response-only schemas and the models nested in them.
+    
+    Responses are built once from server-side data: they are frozen,
+    drop unknown keys and build their core schemas on first use.
+    """
+    
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        defer_build=True,
+    )
+
+
+# Codes raised by app.core.exceptions and the global exception handler
+ErrorCode = Literal[
+    "INTERNAL_ERROR",
+    "AUTHENTICATION_ERROR",
+    "RATE_LIMIT_EXCEEDED",
+    "PROVIDER_UNAVAILABLE",
+    "PROVIDER_ERROR",
+    "MODEL_NOT_FOUND",
+    "VALIDATION_ERROR",
+    "SERVICE_UNAVAILABLE",
+    "TIMEOUT_ERROR",
+]
+
+
+class ErrorDetail(TypedDict):
     """
     Detailed error information.
     
@@ -25,23 +155,21 @@ class ErrorDetail(BaseModel):
         details: Additional error context
     """
     
-    code: str = Field(
-        ...,
+    code: Annotated[ErrorCode, Field(
         description="Machine-readable error code",
         examples=["VALIDATION_ERROR", "AUTHENTICATION_ERROR"],
-    )
-    message: str = Field(
-        ...,
+    )]
+    message: Annotated[str, Field(
         description="Human-readable error message",
         examples=["Invalid API key provided"],
-    )
-    details: Optional[Dict[str, Any]] = Field(
-        default=None,
+    )]
+    # Passed through as-is: exceptions build this dict themselves
+    details: NotRequired[Annotated[Any, Field(
         description="Additional error context",
-    )
+    )]]
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(ResponseBase):
     """
     Standard error response format.
     
@@ -58,7 +186,7 @@ class ErrorResponse(BaseModel):
     )
 
 
-class MetadataResponse(BaseModel):
+class MetadataResponse(ResponseBase):
     """
     Response metadata for tracking and analytics.
     
@@ -76,28 +204,24 @@ class MetadataResponse(BaseModel):
         description="Provider name",
         examples=["ollama"],
     )
-    tokens_used: Optional[int] = Field(
+    tokens_used: Optional[NonNegInt] = Field(
         default=None,
         description="Total tokens consumed",
-        ge=0,
     )
-    prompt_tokens: Optional[int] = Field(
+    prompt_tokens: Optional[NonNegInt] = Field(
         default=None,
         description="Tokens in the prompt",
-        ge=0,
     )
-    completion_tokens: Optional[int] = Field(
+    completion_tokens: Optional[NonNegInt] = Field(
         default=None,
         description="Tokens in the completion",
-        ge=0,
     )
-    latency_ms: Optional[float] = Field(
+    latency_ms: Optional[NonNegFloat] = Field(
         default=None,
         description="Processing latency in milliseconds",
-        ge=0,
     )
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_coarse_utcnow,
         description="Response timestamp (UTC)",
     )
     request_id: Optional[str] = Field(
@@ -106,7 +230,7 @@ class MetadataResponse(BaseModel):
     )
 
 
-class APIResponse(BaseModel, Generic[T]):
+class APIResponse(ResponseBase, Generic[T]):
     """
     Standard successful response wrapper.
     
@@ -134,20 +258,17 @@ class APIResponse(BaseModel, Generic[T]):
     )
 
 
-class PaginationParams(BaseModel):
+class PaginationParams(BaseSchema):
     """
     Pagination parameters for list endpoints.
     """
     
-    page: int = Field(
+    page: PosInt = Field(
         default=1,
-        ge=1,
         description="Page number (1-indexed)",
     )
-    page_size: int = Field(
+    page_size: PageSize = Field(
         default=20,
-        ge=1,
-        le=100,
         description="Items per page",
     )
     
@@ -157,7 +278,7 @@ class PaginationParams(BaseModel):
         return (self.page - 1) * self.page_size
 
 
-class PaginatedResponse(BaseModel, Generic[T]):
+class PaginatedResponse(ResponseBase, Generic[T]):
     """
     Paginated list response.
     """
@@ -166,23 +287,21 @@ class PaginatedResponse(BaseModel, Generic[T]):
         ...,
         description="List of items",
     )
-    total: int = Field(
+    total: NonNegInt = Field(
         ...,
-        ge=0,
         description="Total number of items",
     )
-    page: int = Field(
+    page: PosInt = Field(
         ...,
-        ge=1,
         description="Current page number",
     )
-    page_size: int = Field(
+    page_size: PosInt = Field(
         ...,
-        ge=1,
         description="Items per page",
     )
-    pages: int = Field(
-        ...,
-        ge=0,
-        description="Total number of pages",
-    )
+    
+    @computed_field(description="Total number of pages")
+    @cached_property
+    def pages(self) -> int:
+        """Derived from total and page_size, so callers don't pass it."""
+        return -(-self.total // self.page_size)
@@ -6,27 +6,33 @@ Schemas for insight generation and interactive queries.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+from typing_extensions import TypedDict
 
+from .common import BaseSchema, IsoDatetime, ResponseBase
 
-class InsightContext(BaseModel):
+
+# Shared low/medium/high scale. Literal validation hands back the one
+# canonical str object per value, so records don't each hold a copy.
+Level = Literal["low", "medium", "high"]
+
+
+class InsightContext(TypedDict, total=False):
     """Context for insight generation."""
     
-    time_range: Optional[str] = Field(
-        default=None,
+    time_range: Annotated[Optional[str], Field(
         description="Time range for analysis",
         examples=["2026-01-31T00:00:00Z to 2026-01-31T23:59:59Z"],
-    )
-    network_region: Optional[str] = Field(
-        default=None,
+    )]
+    network_region: Annotated[Optional[str], Field(
         description="Network region identifier",
         examples=["East_Region"],
-    )
+    )]
 
 
-class GenerateInsightsRequest(BaseModel):
+class GenerateInsightsRequest(BaseSchema):
     """Request for generating LLM insights."""
     
     topology_id: str = Field(
@@ -50,7 +56,7 @@ class GenerateInsightsRequest(BaseModel):
     )
 
 
-class GenerateInsightsResponse(BaseModel):
+class GenerateInsightsResponse(ResponseBase):
     """Response from insight generation."""
     
     report_id: str = Field(
@@ -75,7 +81,7 @@ class GenerateInsightsResponse(BaseModel):
     )
 
 
-class NetworkInsight(BaseModel):
+class NetworkInsight(ResponseBase):
     """A single network insight."""
     
     insight_id: str = Field(
@@ -83,12 +89,12 @@ class NetworkInsight(BaseModel):
         description="Unique insight identifier",
         examples=["ins_001"],
     )
-    type: str = Field(
+    type: Literal["congestion_alert", "anomaly_detected", "propagation_detected"] = Field(
         ...,
         description="Insight type: congestion_alert, anomaly_detected, propagation_detected",
         examples=["congestion_alert"],
     )
-    severity: str = Field(
+    severity: Level = Field(
         ...,
         description="Severity: low, medium, high",
         examples=["high"],
@@ -108,14 +114,14 @@ class NetworkInsight(BaseModel):
         description="List of affected entities",
         examples=[["Group_1"]],
     )
-    timestamp: str = Field(
+    timestamp: IsoDatetime = Field(
         ...,
         description="Insight timestamp (ISO 8601)",
         examples=["2026-01-31T10:45:00Z"],
     )
 
 
-class ActionRecommendation(BaseModel):
+class ActionRecommendation(ResponseBase):
     """A recommended action for addressing issues."""
     
     recommendation_id: str = Field(
@@ -128,12 +134,12 @@ class ActionRecommendation(BaseModel):
         description="Related insight ID",
         examples=["ins_001"],
     )
-    action_type: str = Field(
+    action_type: Literal["capacity_upgrade", "traffic_shaping", "hardware_check", "reroute"] = Field(
         ...,
         description="Action type: capacity_upgrade, traffic_shaping, hardware_check, reroute",
         examples=["capacity_upgrade"],
     )
-    priority: str = Field(
+    priority: Level = Field(
         ...,
         description="Priority: low, medium, high",
         examples=["high"],
@@ -152,7 +158,7 @@ class ActionRecommendation(BaseModel):
         description="Expected impact of the action",
         examples=["Reduce packet loss by 45-60%"],
     )
-    estimated_effort: str = Field(
+    estimated_effort: Level = Field(
         ...,
         description="Effort level: low, medium, high",
         examples=["medium"],
@@ -163,7 +169,7 @@ class ActionRecommendation(BaseModel):
     )
 
 
-class TopologySummary(BaseModel):
+class TopologySummary(ResponseBase):
     """Summary of topology analysis."""
     
     total_cells: int = Field(
@@ -188,7 +194,7 @@ class TopologySummary(BaseModel):
     )
 
 
-class ReportMetadata(BaseModel):
+class ReportMetadata(ResponseBase):
     """Metadata for the analysis report."""
     
     analysis_duration_sec: Optional[float] = Field(
@@ -201,14 +207,14 @@ class ReportMetadata(BaseModel):
         description="Number of data points analyzed",
         examples=[150000],
     )
-    confidence_level: str = Field(
+    confidence_level: Level = Field(
         default="medium",
         description="Overall confidence: low, medium, high",
         examples=["high"],
     )
 
 
-class CopilotReport(BaseModel):
+class CopilotReport(ResponseBase):
     """Complete copilot report."""
     
     report_id: str = Field(
@@ -216,7 +222,7 @@ class CopilotReport(BaseModel):
         description="Unique report identifier",
         examples=["rpt_001"],
     )
-    generated_at: str = Field(
+    generated_at: IsoDatetime = Field(
         ...,
         description="Generation timestamp (ISO 8601)",
         examples=["2026-01-31T10:50:00Z"],
@@ -229,7 +235,7 @@ class CopilotReport(BaseModel):
         ...,
         description="Summary of topology analysis",
     )
-    health_status: str = Field(
+    health_status: Literal["healthy", "degraded", "critical"] = Field(
         ...,
         description="Overall health: healthy, degraded, critical",
         examples=["degraded"],
@@ -248,22 +254,20 @@ class CopilotReport(BaseModel):
     )
 
 
-class QueryContext(BaseModel):
+class QueryContext(TypedDict, total=False):
     """Context for interactive queries."""
     
-    report_id: Optional[str] = Field(
-        default=None,
+    report_id: Annotated[Optional[str], Field(
         description="Report ID for context",
         examples=["rpt_001"],
-    )
-    topology_id: Optional[str] = Field(
-        default=None,
+    )]
+    topology_id: Annotated[Optional[str], Field(
         description="Topology ID for context",
         examples=["topo_001"],
-    )
+    )]
 
 
-class QueryRequest(BaseModel):
+class QueryRequest(BaseSchema):
     """Request for interactive query."""
     
     query: str = Field(
@@ -277,16 +281,16 @@ class QueryRequest(BaseModel):
     )
 
 
-class SupportingData(BaseModel):
+class SupportingData(ResponseBase):
     """Supporting data for query response."""
     
-    group_id: Optional[str] = Field(default=None)
-    congestion_level: Optional[float] = Field(default=None)
-    affected_cells: Optional[List[str]] = Field(default=None)
-    packet_loss_increase_pct: Optional[float] = Field(default=None)
+    group_id: Optional[str] = None
+    congestion_level: Optional[float] = None
+    affected_cells: Optional[List[str]] = None
+    packet_loss_increase_pct: Optional[float] = None
 
 
-class QueryResponse(BaseModel):
+class QueryResponse(ResponseBase):
     """Response to interactive query."""
     
     query_id: str = Field(
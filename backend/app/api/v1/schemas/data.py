@@ -6,32 +6,77 @@ Schemas for data upload requests and responses.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import ConfigDict, Field, TypeAdapter, model_validator
+from typing_extensions import TypedDict
 
+from .common import BaseSchema, IsoDatetime, ResponseBase
 
-class DataMetadata(BaseModel):
+
+class DataMetadata(TypedDict, total=False):
     """Metadata for uploaded data."""
     
-    start_time: Optional[str] = Field(
-        default=None,
+    start_time: Annotated[Optional[IsoDatetime], Field(
         description="Start time of the data range (ISO 8601)",
         examples=["2026-01-31T00:00:00Z"],
-    )
-    end_time: Optional[str] = Field(
-        default=None,
+    )]
+    end_time: Annotated[Optional[IsoDatetime], Field(
         description="End time of the data range (ISO 8601)",
         examples=["2026-01-31T23:59:59Z"],
-    )
-    cell_count: Optional[int] = Field(
-        default=None,
+    )]
+    cell_count: Annotated[Optional[int], Field(
         description="Number of cells in the data",
         examples=[24],
+    )]
+
+
+class LossEventBatch(BaseSchema):
+    """
+    Loss events in columnar form (format="columnar").
+    
+    Parallel slot/cell id lists plus one byte per loss flag, instead of
+    one JSON object per record.
+    """
+    
+    model_config = ConfigDict(
+        val_json_bytes="base64",
+        ser_json_bytes="base64",
     )
+    
+    slot_ids: List[int] = Field(
+        ...,
+        description="Time slot identifier of each record",
+    )
+    cell_ids: List[int] = Field(
+        ...,
+        description="Cell identifier of each record",
+    )
+    loss_events: bytes = Field(
+        ...,
+        description="Loss flag of each record, one byte (0 or 1) per record, base64 in JSON",
+    )
+    
+    @model_validator(mode="after")
+    def validate_columns(self) -> "LossEventBatch":
+        """Check the three columns line up and flags are 0/1."""
+        if not len(self.slot_ids) == len(self.cell_ids) == len(self.loss_events):
+            raise ValueError("slot_ids, cell_ids and loss_events must have the same length")
+        if self.loss_events.translate(None, b"\x00\x01"):
+            raise ValueError("loss_events bytes must be 0 or 1")
+        return self
+    
+    def to_columns(self) -> Dict[str, np.ndarray]:
+        """Columns keyed like LossEventRecord (loss_event is a view on the bytes)."""
+        return {
+            "slot_id": np.asarray(self.slot_ids, dtype=np.int64),
+            "cell_id": np.asarray(self.cell_ids, dtype=np.int64),
+            "loss_event": np.frombuffer(self.loss_events, dtype=np.uint8),
+        }
 
 
-class DataUploadRequest(BaseModel):
+class DataUploadRequest(BaseSchema):
     """Request for uploading telemetry data."""
     
     data_type: str = Field(
@@ -41,7 +86,7 @@ class DataUploadRequest(BaseModel):
     )
     format: str = Field(
         default="csv",
-        description="Data format",
+        description="Data format: csv, or columnar when sending batch",
         examples=["csv"],
     )
     file_url: Optional[str] = Field(
@@ -49,9 +94,13 @@ class DataUploadRequest(BaseModel):
         description="URL to the data file (for remote files)",
         examples=["s3://bucket/loss_data.csv"],
     )
-    data: Optional[List[Dict[str, Any]]] = Field(
+    data: Optional[List[Any]] = Field(
+        default=None,
+        description="Inline data records (alternative to file_url); validated as LossEventRecord or ThroughputRecord according to data_type",
+    )
+    batch: Optional[LossEventBatch] = Field(
         default=None,
-        description="Inline data records (alternative to file_url)",
+        description="Columnar loss events (alternative to data for large uploads)",
     )
     metadata: Optional[DataMetadata] = Field(
         default=None,
@@ -59,7 +108,7 @@ class DataUploadRequest(BaseModel):
     )
 
 
-class DataUploadResponse(BaseModel):
+class DataUploadResponse(ResponseBase):
     """Response after data upload."""
     
     upload_id: str = Field(
@@ -67,7 +116,7 @@ class DataUploadResponse(BaseModel):
         description="Unique identifier for this upload",
         examples=["upl_abc123"],
     )
-    status: str = Field(
+    status: Literal["processing", "completed", "failed"] = Field(
         ...,
         description="Upload status: processing, completed, failed",
         examples=["processing"],
@@ -84,41 +133,43 @@ class DataUploadResponse(BaseModel):
     )
 
 
-class LossEventRecord(BaseModel):
+class LossEventRecord(TypedDict):
     """Single loss event record."""
     
-    slot_id: int = Field(
-        ...,
+    slot_id: Annotated[int, Field(
         description="Time slot identifier",
         examples=[1],
-    )
-    cell_id: int = Field(
-        ...,
+    )]
+    cell_id: Annotated[int, Field(
         description="Cell identifier",
         examples=[1],
-    )
-    loss_event: int = Field(
-        ...,
+    )]
+    loss_event: Annotated[int, Field(
         description="Loss event flag: 0 = no loss, 1 = loss",
         examples=[0, 1],
-    )
+    )]
 
 
-class ThroughputRecord(BaseModel):
+class ThroughputRecord(TypedDict):
     """Single throughput record."""
     
-    slot_id: int = Field(
-        ...,
+    slot_id: Annotated[int, Field(
         description="Time slot identifier",
         examples=[1],
-    )
-    cell_id: int = Field(
-        ...,
+    )]
+    cell_id: Annotated[int, Field(
         description="Cell identifier",
         examples=[1],
-    )
-    throughput_slot: float = Field(
-        ...,
+    )]
+    throughput_slot: Annotated[float, Field(
         description="Throughput value for this slot",
         examples=[30.656],
-    )
+    )]
+
+
+# Built once at import: validating a whole record list through one adapter
+# avoids rebuilding the core schema per request
+LOSS_EVENTS_ADAPTER: TypeAdapter[List[LossEventRecord]] = TypeAdapter(List[LossEventRecord])
+THROUGHPUT_ADAPTER: TypeAdapter[List[ThroughputRecord]] = TypeAdapter(List[ThroughputRecord])
+# Dumps validated metadata back to its JSON form (timestamps as ISO 8601 text)
+METADATA_ADAPTER: TypeAdapter[DataMetadata] = TypeAdapter(DataMetadata)
@@ -5,45 +5,51 @@ Health and monitoring schemas.
 Schemas for health checks and system metrics.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .common import IsoDatetime, ResponseBase
 
-class ServiceStatus(BaseModel):
+
+# "unavailable" is reported for the LLM copilot when Ollama can't be reached
+HealthStatus = Literal["healthy", "degraded", "unhealthy", "unavailable"]
+
+
+class ServiceStatus(ResponseBase):
     """Status of a single service."""
     
-    data_ingestion: str = Field(
+    data_ingestion: HealthStatus = Field(
         default="healthy",
         description="Data ingestion service status",
     )
-    similarity_engine: str = Field(
+    similarity_engine: HealthStatus = Field(
         default="healthy",
         description="Similarity engine status",
     )
-    clustering_engine: str = Field(
+    clustering_engine: HealthStatus = Field(
         default="healthy",
         description="Clustering engine status",
     )
-    ml_analytics: str = Field(
+    ml_analytics: HealthStatus = Field(
         default="healthy",
         description="ML analytics status",
     )
-    llm_copilot: str = Field(
+    llm_copilot: HealthStatus = Field(
         default="healthy",
         description="LLM copilot status",
     )
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(ResponseBase):
     """Health check response."""
     
-    status: str = Field(
+    status: Literal["healthy", "degraded", "unhealthy"] = Field(
         ...,
         description="Overall status: healthy, degraded, unhealthy",
         examples=["healthy"],
     )
-    timestamp: str = Field(
+    timestamp: IsoDatetime = Field(
         ...,
         description="Check timestamp (ISO 8601)",
         examples=["2026-01-31T11:00:00Z"],
@@ -59,7 +65,7 @@ class HealthResponse(BaseModel):
     )
 
 
-class MetricsResponse(BaseModel):
+class MetricsResponse(ResponseBase):
     """System metrics response."""
     
     requests_per_minute: int = Field(
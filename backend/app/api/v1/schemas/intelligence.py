@@ -6,12 +6,23 @@ Schemas for anomaly detection and propagation analysis.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .common import BaseSchema, IsoDatetime, ResponseBase
 
-class DetectAnomaliesRequest(BaseModel):
+
+# Closed vocabularies, matched by pydantic-core's literal validator
+AnomalyMethod = Literal["isolation_forest", "zscore", "local_outlier_factor"]
+AnomalySeverity = Literal["none", "low", "medium", "high"]
+AnomalyType = Literal["low_correlation", "temporal_mismatch"]
+Direction = Literal["upstream", "downstream", "bidirectional"]
+PathType = Literal["cascading_congestion", "feedback_loop"]
+NodeType = Literal["source", "intermediate", "target", "isolated"]
+
+
+class DetectAnomaliesRequest(BaseSchema):
     """Request for anomaly detection."""
     
     topology_id: str = Field(
@@ -29,14 +40,14 @@ class DetectAnomaliesRequest(BaseModel):
         description="Confidence score threshold (lower = anomaly)",
         examples=[0.5],
     )
-    method: str = Field(
+    method: AnomalyMethod = Field(
         default="isolation_forest",
         description="Detection method: isolation_forest, zscore, local_outlier_factor",
         examples=["isolation_forest"],
     )
 
 
-class DetectAnomaliesResponse(BaseModel):
+class DetectAnomaliesResponse(ResponseBase):
     """Response from anomaly detection."""
     
     analysis_id: str = Field(
@@ -61,7 +72,7 @@ class DetectAnomaliesResponse(BaseModel):
     )
 
 
-class AnomalyScore(BaseModel):
+class AnomalyScore(ResponseBase):
     """Anomaly score for a single cell."""
     
     cell_id: str = Field(
@@ -84,14 +95,14 @@ class AnomalyScore(BaseModel):
         description="Whether this cell is classified as anomalous",
         examples=[True],
     )
-    anomaly_type: Optional[str] = Field(
+    anomaly_type: Optional[AnomalyType] = Field(
         default=None,
         description="Type of anomaly: low_correlation, temporal_mismatch",
         examples=["low_correlation"],
     )
-    severity: str = Field(
+    severity: AnomalySeverity = Field(
         default="medium",
-        description="Severity: low, medium, high",
+        description="Severity: none, low, medium, high",
         examples=["high"],
     )
     deviation_percentage: Optional[float] = Field(
@@ -106,7 +117,7 @@ class AnomalyScore(BaseModel):
     )
 
 
-class AnomalyStatistics(BaseModel):
+class AnomalyStatistics(ResponseBase):
     """Statistics for anomaly analysis."""
     
     avg_confidence: float = Field(
@@ -126,7 +137,7 @@ class AnomalyStatistics(BaseModel):
     )
 
 
-class AnomalyResult(BaseModel):
+class AnomalyResult(ResponseBase):
     """Complete anomaly detection result."""
     
     analysis_id: str = Field(
@@ -134,7 +145,7 @@ class AnomalyResult(BaseModel):
         description="Unique analysis identifier",
         examples=["anom_001"],
     )
-    analyzed_at: str = Field(
+    analyzed_at: IsoDatetime = Field(
         ...,
         description="Analysis timestamp (ISO 8601)",
         examples=["2026-01-31T10:40:00Z"],
@@ -168,7 +179,7 @@ class AnomalyResult(BaseModel):
     )
 
 
-class AnalyzePropagationRequest(BaseModel):
+class AnalyzePropagationRequest(BaseSchema):
     """Request for propagation analysis."""
     
     topology_id: str = Field(
@@ -198,7 +209,7 @@ class AnalyzePropagationRequest(BaseModel):
     )
 
 
-class AnalyzePropagationResponse(BaseModel):
+class AnalyzePropagationResponse(ResponseBase):
     """Response from propagation analysis."""
     
     propagation_id: str = Field(
@@ -223,7 +234,7 @@ class AnalyzePropagationResponse(BaseModel):
     )
 
 
-class PropagationEvent(BaseModel):
+class PropagationEvent(ResponseBase):
     """A single propagation event between groups."""
     
     event_id: str = Field(
@@ -251,7 +262,7 @@ class PropagationEvent(BaseModel):
         description="Correlation strength",
         examples=[0.73],
     )
-    direction: str = Field(
+    direction: Direction = Field(
         ...,
         description="Direction: upstream, downstream, bidirectional",
         examples=["downstream"],
@@ -261,14 +272,14 @@ class PropagationEvent(BaseModel):
         description="Confidence in this detection",
         examples=[0.81],
     )
-    timestamp: str = Field(
+    timestamp: IsoDatetime = Field(
         ...,
         description="Event timestamp (ISO 8601)",
         examples=["2026-01-31T10:15:23Z"],
     )
 
 
-class PropagationPath(BaseModel):
+class PropagationPath(ResponseBase):
     """A propagation path through multiple groups."""
     
     path_id: str = Field(
@@ -291,14 +302,14 @@ class PropagationPath(BaseModel):
         description="Overall path strength",
         examples=[0.71],
     )
-    type: str = Field(
+    type: PathType = Field(
         ...,
         description="Path type: cascading_congestion, feedback_loop",
         examples=["cascading_congestion"],
     )
 
 
-class NetworkNode(BaseModel):
+class NetworkNode(ResponseBase):
     """Node in the network graph."""
     
     id: str = Field(
@@ -306,9 +317,9 @@ class NetworkNode(BaseModel):
         description="Node identifier",
         examples=["Group_1"],
     )
-    type: str = Field(
+    type: NodeType = Field(
         ...,
-        description="Node type: source, intermediate, target",
+        description="Node type: source, intermediate, target, isolated",
         examples=["source"],
     )
     congestion_level: float = Field(
@@ -318,7 +329,7 @@ class NetworkNode(BaseModel):
     )
 
 
-class NetworkEdge(BaseModel):
+class NetworkEdge(ResponseBase):
     """Edge in the network graph."""
     
     source: str = Field(
@@ -343,7 +354,7 @@ class NetworkEdge(BaseModel):
     )
 
 
-class NetworkGraph(BaseModel):
+class NetworkGraph(ResponseBase):
     """Network propagation graph."""
     
     nodes: List[NetworkNode] = Field(
@@ -356,7 +367,7 @@ class NetworkGraph(BaseModel):
     )
 
 
-class PropagationResult(BaseModel):
+class PropagationResult(ResponseBase):
     """Complete propagation analysis result."""
     
     propagation_id: str = Field(
@@ -364,7 +375,7 @@ class PropagationResult(BaseModel):
         description="Unique analysis identifier",
         examples=["prop_001"],
     )
-    analyzed_at: str = Field(
+    analyzed_at: IsoDatetime = Field(
         ...,
         description="Analysis timestamp (ISO 8601)",
         examples=["2026-01-31T10:45:00Z"],
@@ -6,12 +6,19 @@ Schemas for similarity computation and topology inference.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .common import BaseSchema, IsoDatetime, ResponseBase
 
-class ComputeSimilarityRequest(BaseModel):
+
+# Closed vocabularies, matched by pydantic-core's literal validator
+SimilarityMethod = Literal["correlation", "dtw", "mutual_info"]
+ClusteringMethod = Literal["hierarchical", "kmeans", "dbscan"]
+
+
+class ComputeSimilarityRequest(BaseSchema):
     """Request to compute similarity matrix."""
     
     upload_id: str = Field(
@@ -19,7 +26,7 @@ class ComputeSimilarityRequest(BaseModel):
         description="ID of the uploaded data to analyze",
         examples=["upl_abc123"],
     )
-    method: str = Field(
+    method: SimilarityMethod = Field(
         default="correlation",
         description="Similarity method: correlation, dtw, mutual_info",
         examples=["correlation"],
@@ -36,7 +43,7 @@ class ComputeSimilarityRequest(BaseModel):
     )
 
 
-class ComputeSimilarityResponse(BaseModel):
+class ComputeSimilarityResponse(ResponseBase):
     """Response from similarity computation."""
     
     job_id: str = Field(
@@ -66,7 +73,7 @@ class ComputeSimilarityResponse(BaseModel):
     )
 
 
-class SimilarityMatrix(BaseModel):
+class SimilarityMatrix(ResponseBase):
     """Similarity matrix result."""
     
     similarity_id: str = Field(
@@ -88,18 +95,18 @@ class SimilarityMatrix(BaseModel):
         description="Method used for computation",
         examples=["correlation"],
     )
-    computed_at: str = Field(
+    computed_at: IsoDatetime = Field(
         ...,
         description="Computation timestamp (ISO 8601)",
         examples=["2026-01-31T10:30:00Z"],
     )
     download_url: Optional[str] = Field(
         default=None,
-        description="URL to download the matrix",
+        description="URL to download the matrix as raw float32 bytes",
     )
 
 
-class InferTopologyRequest(BaseModel):
+class InferTopologyRequest(BaseSchema):
     """Request to infer topology from similarity matrix."""
     
     similarity_id: str = Field(
@@ -107,7 +114,7 @@ class InferTopologyRequest(BaseModel):
         description="ID of the similarity matrix to use",
         examples=["sim_001"],
     )
-    clustering_method: str = Field(
+    clustering_method: ClusteringMethod = Field(
         default="hierarchical",
         description="Clustering method: hierarchical, kmeans, dbscan",
         examples=["hierarchical"],
@@ -124,7 +131,7 @@ class InferTopologyRequest(BaseModel):
     )
 
 
-class InferTopologyResponse(BaseModel):
+class InferTopologyResponse(ResponseBase):
     """Response from topology inference."""
     
     topology_id: str = Field(
@@ -149,7 +156,7 @@ class InferTopologyResponse(BaseModel):
     )
 
 
-class LinkGroup(BaseModel):
+class LinkGroup(ResponseBase):
     """A group of cells sharing a common link."""
     
     group_id: str = Field(
@@ -179,7 +186,7 @@ class LinkGroup(BaseModel):
     )
 
 
-class CellAssignment(BaseModel):
+class CellAssignment(ResponseBase):
     """Assignment of a cell to a group."""
     
     cell_id: str = Field(
@@ -199,7 +206,7 @@ class CellAssignment(BaseModel):
     )
 
 
-class TopologyResult(BaseModel):
+class TopologyResult(ResponseBase):
     """Complete topology inference result."""
     
     topology_id: str = Field(
@@ -207,7 +214,7 @@ class TopologyResult(BaseModel):
         description="Unique identifier for this result",
         examples=["topo_001"],
     )
-    created_at: str = Field(
+    created_at: IsoDatetime = Field(
         ...,
         description="Creation timestamp (ISO 8601)",
         examples=["2026-01-31T10:35:00Z"],
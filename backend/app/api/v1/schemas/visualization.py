@@ -5,12 +5,20 @@ Visualization schemas.
 Schemas for generating various visualization types.
 """
 
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .common import BaseSchema, ResponseBase
 
-class HeatmapRequest(BaseModel):
+
+# Closed vocabularies, matched by pydantic-core's literal validator
+ImageFormat = Literal["png", "svg", "pdf"]
+GraphLayout = Literal["spring", "circular", "kamada_kawai"]
+VisualizationType = Literal["heatmap", "topology_graph", "propagation_flow"]
+
+
+class HeatmapRequest(BaseSchema):
     """Request for generating a similarity heatmap."""
     
     similarity_id: str = Field(
@@ -18,7 +26,7 @@ class HeatmapRequest(BaseModel):
         description="ID of the similarity matrix",
         examples=["sim_001"],
     )
-    format: str = Field(
+    format: ImageFormat = Field(
         default="png",
         description="Output format: png, svg, pdf",
         examples=["png"],
@@ -35,7 +43,7 @@ class HeatmapRequest(BaseModel):
     )
 
 
-class TopologyGraphRequest(BaseModel):
+class TopologyGraphRequest(BaseSchema):
     """Request for generating a topology graph."""
     
     topology_id: str = Field(
@@ -43,12 +51,12 @@ class TopologyGraphRequest(BaseModel):
         description="ID of the topology result",
         examples=["topo_001"],
     )
-    format: str = Field(
+    format: ImageFormat = Field(
         default="png",
         description="Output format: png, svg, pdf",
         examples=["png"],
     )
-    layout: str = Field(
+    layout: GraphLayout = Field(
         default="spring",
         description="Graph layout: spring, circular, kamada_kawai",
         examples=["spring"],
@@ -64,7 +72,7 @@ class TopologyGraphRequest(BaseModel):
     )
 
 
-class PropagationFlowRequest(BaseModel):
+class PropagationFlowRequest(BaseSchema):
     """Request for generating a propagation flow diagram."""
     
     propagation_id: str = Field(
@@ -72,7 +80,7 @@ class PropagationFlowRequest(BaseModel):
         description="ID of the propagation analysis",
         examples=["prop_001"],
     )
-    format: str = Field(
+    format: Literal["png", "svg"] = Field(
         default="svg",
         description="Output format: png, svg",
         examples=["svg"],
@@ -87,7 +95,7 @@ class PropagationFlowRequest(BaseModel):
     )
 
 
-class VisualizationResponse(BaseModel):
+class VisualizationResponse(ResponseBase):
     """Response from visualization generation."""
     
     visualization_id: str = Field(
@@ -95,7 +103,7 @@ class VisualizationResponse(BaseModel):
         description="Unique visualization identifier",
         examples=["viz_heat_001"],
     )
-    type: str = Field(
+    type: VisualizationType = Field(
         ...,
         description="Visualization type: heatmap, topology_graph, propagation_flow",
         examples=["heatmap"],
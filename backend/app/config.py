@@ -6,8 +6,8 @@ This module provides centralized configuration for the API backend,
 supporting different environments (development, staging, production).
 """
 
-from functools import lru_cache
-from typing import List, Optional
+from functools import cached_property, lru_cache
+from typing import FrozenSet, List, Literal, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -26,6 +26,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
     
     # ========================
@@ -165,7 +166,7 @@ class Settings(BaseSettings):
     # ========================
     # Logging Settings
     # ========================
-    log_level: str = Field(
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
         default="INFO",
         description="Logging level: DEBUG, INFO, WARNING, ERROR, CRITICAL"
     )
@@ -181,26 +182,33 @@ class Settings(BaseSettings):
     # ========================
     # Computed Properties
     # ========================
-    @property
+    # Parsed lists are cached on the (frozen) instance: parsed once, then
+    # read on every request by the CORS middleware and API key checks
+    @cached_property
     def api_keys_list(self) -> List[str]:
         """Parse comma-separated API keys into a list."""
         if not self.api_keys:
             return []
         return [key.strip() for key in self.api_keys.split(",") if key.strip()]
     
-    @property
+    @cached_property
+    def api_keys_set(self) -> FrozenSet[str]:
+        """Valid API keys as a set, for constant-time membership checks."""
+        return frozenset(self.api_keys_list)
+    
+    @cached_property
     def cors_origins_list(self) -> List[str]:
         """Parse comma-separated CORS origins into a list."""
         if self.cors_origins == "*":
             return ["*"]
         return [origin.strip() for origin in self.cors_origins.split(",") if origin.strip()]
     
-    @property
+    @cached_property
     def cors_methods_list(self) -> List[str]:
         """Parse comma-separated CORS methods into a list."""
         return [method.strip() for method in self.cors_allow_methods.split(",") if method.strip()]
     
-    @property
+    @cached_property
     def cors_headers_list(self) -> List[str]:
         """Parse comma-separated CORS headers into a list."""
         if self.cors_allow_headers == "*":
@@ -217,15 +225,11 @@ class Settings(BaseSettings):
         """Check if running in development environment."""
         return self.app_env.lower() == "development"
     
-    @field_validator("log_level")
+    @field_validator("log_level", mode="before")
     @classmethod
-    def validate_log_level(cls, v: str) -> str:
-        """Validate and normalize log level."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        normalized = v.upper()
-        if normalized not in valid_levels:
-            raise ValueError(f"Invalid log level: {v}. Must be one of {valid_levels}")
-        return normalized
+    def normalize_log_level(cls, v: object) -> object:
+        """Upper-case the log level; the Literal type does the checking."""
+        return v.upper() if isinstance(v, str) else v
 
 
 @lru_cache()
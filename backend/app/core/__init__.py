@@ -6,6 +6,7 @@ This package contains:
 - Exception handling
 - Security utilities
 - Structured logging
+- Response classes
 """
 
 from .exceptions import (
@@ -17,6 +18,7 @@ from .exceptions import (
     ValidationError,
 )
 from .logging import get_logger, setup_logging
+from .responses import ORJSONResponse, orjson_dumps
 
 __all__ = [
     "APIException",
@@ -27,4 +29,6 @@ __all__ = [
     "ValidationError",
     "get_logger",
     "setup_logging",
+    "ORJSONResponse",
+    "orjson_dumps",
 ]
@@ -0,0 +1,30 @@
+# backend/app/core/responses.py
+"""
+Response classes shared by the application.
+
+ORJSONResponse renders with orjson instead of the stdlib json module,
+which is markedly faster for the large numeric payloads served here
+(similarity matrices, cell lists).
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def orjson_dumps(content: Any) -> bytes:
+    """Encode content the way ORJSONResponse does (for pre-encoded bodies)."""
+    return orjson.dumps(content, option=_ORJSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (NumPy values allowed)."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson_dumps(content)
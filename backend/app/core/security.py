@@ -55,7 +55,7 @@ def validate_api_key(api_key: Optional[str]) -> str:
         logger.warning("Missing API key in request")
         raise AuthenticationError("Missing API key")
     
-    valid_keys = settings.api_keys_list
+    valid_keys = settings.api_keys_set
     
     # If no keys configured, allow all (development mode warning)
     if not valid_keys:
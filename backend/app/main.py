@@ -16,7 +16,9 @@ from fastapi.responses import JSONResponse
 
 from app.config import settings
 from app.core.exceptions import APIException
+from app.core.responses import ORJSONResponse
 from app.api.v1 import router as v1_router
+from app.api.v1.schemas import build_schemas
 
 
 @asynccontextmanager
@@ -30,6 +32,10 @@ async def lifespan(app: FastAPI):
     print(f"🚀 Starting {settings.app_name} v1.0.0")
     print(f"📡 Environment: {settings.app_env}")
     print(f"🔗 API docs available at: http://{settings.host}:{settings.port}/docs")
+    # Build the OpenAPI document once at startup; FastAPI memoizes it in
+    # app.openapi_schema, so /openapi.json and /docs never walk the models
+    app.openapi()
+    build_schemas()
     yield
     # Shutdown
     print(f"👋 Shutting down {settings.app_name}")
@@ -63,6 +69,7 @@ A three-layer intelligence architecture for fronthaul network analysis:
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -73,6 +80,8 @@ app.add_middleware(
     allow_credentials=settings.cors_allow_credentials,
     allow_methods=settings.cors_methods_list,
     allow_headers=settings.cors_headers_list,
+    # Binary similarity matrix metadata (/similarity-matrix.bin, /similarity/{id}/raw)
+    expose_headers=["X-Matrix-Shape", "X-Matrix-Dtype"],
 )
 
 
@@ -135,4 +144,10 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.is_development,
+        # loop/http stay on uvicorn's "auto", which uses uvloop and httptools
+        # when uvicorn[standard] is installed; keep-alive outlasts the
+        # frontend's polling interval
+        backlog=2048,
+        limit_concurrency=1024,
+        timeout_keep_alive=30,
     )
@@ -44,7 +44,7 @@ class AnomalyService:
         if not similarity:
             raise ValueError(f"Similarity matrix not found: {similarity_id}")
         
-        matrix = np.array(similarity["matrix"])
+        matrix = similarity["matrix"]
         cell_ids = similarity["cell_ids"]
         groups = topology["groups"]
         
@@ -53,24 +53,23 @@ class AnomalyService:
         normal_cells = []
         all_scores = []
         
+        # Cell -> matrix position, built once instead of list.index() per lookup
+        cell_index = {cell: i for i, cell in enumerate(cell_ids)}
+        
         for group in groups:
-            group_cells = group["cells"]
-            group_indices = [cell_ids.index(c) for c in group_cells if c in cell_ids]
+            members = [cell for cell in group["cells"] if cell in cell_index]
+            group_indices = np.array([cell_index[c] for c in members], dtype=np.intp)
+            n_members = len(members)
             
-            for cell in group_cells:
-                if cell not in cell_ids:
-                    continue
-                    
-                cell_idx = cell_ids.index(cell)
-                
-                # Compute confidence as average similarity to group members
-                if len(group_indices) > 1:
-                    other_indices = [i for i in group_indices if i != cell_idx]
-                    similarities = [matrix[cell_idx][i] for i in other_indices]
-                    confidence = float(np.mean(similarities))
-                else:
-                    confidence = 1.0
-                
+            # Compute confidence as average similarity to group members
+            if n_members > 1:
+                group_sim = matrix[np.ix_(group_indices, group_indices)]
+                off_diagonal = ~np.eye(n_members, dtype=bool)
+                confidences = group_sim[off_diagonal].reshape(n_members, n_members - 1).mean(axis=1)
+            else:
+                confidences = np.ones(n_members)
+            
+            for cell, confidence in zip(members, confidences.tolist()):
                 all_scores.append(confidence)
                 
                 # Determine if anomaly
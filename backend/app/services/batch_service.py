@@ -19,6 +19,11 @@ from app.services.copilot_service import copilot_service
 from app.services.visualization_service import visualization_service
 
 
+# BatchResults id fields in declaration order: status dicts are filled out
+# to the full response shape so the poll endpoint can encode them directly
+_RESULT_ID_KEYS = ("topology_id", "similarity_id", "anomaly_id", "propagation_id", "report_id")
+
+
 class BatchService:
     """Service for batch processing pipelines."""
     
@@ -59,6 +64,7 @@ class BatchService:
         if not config.get("generate_visualizations", True):
             steps = [s for s in steps if s["step"] != "visualization_generation"]
         
+        started_at = datetime.now(timezone.utc)
         storage.store_batch(batch_id, {
             "batch_id": batch_id,
             "upload_id": upload_id,
@@ -66,10 +72,11 @@ class BatchService:
             "status": "processing",
             "steps": steps,
             "results": {},
+            "started_at": started_at.isoformat(),
         })
         
         # Start async processing
-        asyncio.create_task(self._run_pipeline(batch_id, upload_id, config))
+        asyncio.create_task(self._run_pipeline(batch_id, upload_id, config, started_at))
         
         # Calculate estimated time
         estimated_time = datetime.now(timezone.utc)
@@ -87,6 +94,7 @@ class BatchService:
         batch_id: str,
         upload_id: str,
         config: Dict[str, Any],
+        started_at: datetime,
     ) -> None:
         """Run the full pipeline asynchronously."""
         results = {}
@@ -178,10 +186,13 @@ class BatchService:
                 results["visualizations"] = visualizations
                 self._update_step(batch_id, "visualization_generation", "completed", ",".join(visualizations))
             
-            # Update final status
+            # Update final status; the duration is worked out once here
+            # rather than re-parsed from the timestamps on every status poll
+            completed_at = datetime.now(timezone.utc)
             storage.update_batch(batch_id, {
                 "status": "completed",
-                "completed_at": datetime.now(timezone.utc).isoformat(),
+                "completed_at": completed_at.isoformat(),
+                "duration_sec": int((completed_at - started_at).total_seconds()),
                 "results": results,
             })
             
@@ -227,24 +238,18 @@ class BatchService:
         if not batch:
             return None
         
-        # Calculate duration if completed
-        duration_sec = None
-        if batch.get("completed_at") and batch.get("started_at"):
-            try:
-                start = datetime.fromisoformat(batch["started_at"].replace("Z", "+00:00"))
-                end = datetime.fromisoformat(batch["completed_at"].replace("Z", "+00:00"))
-                duration_sec = int((end - start).total_seconds())
-            except:
-                pass
+        results = None
+        if batch["status"] == "completed" and batch.get("results") is not None:
+            results = {**dict.fromkeys(_RESULT_ID_KEYS), "visualizations": [], **batch["results"]}
         
         return {
             "batch_id": batch["batch_id"],
             "status": batch["status"],
             "started_at": batch.get("started_at", ""),
             "completed_at": batch.get("completed_at"),
-            "duration_sec": duration_sec,
+            "duration_sec": batch.get("duration_sec"),
             "steps": batch["steps"],
-            "results": batch.get("results") if batch["status"] == "completed" else None,
+            "results": results,
         }
 
 
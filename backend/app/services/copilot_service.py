@@ -161,7 +161,8 @@ class CopilotService:
         context: Optional[Dict[str, Any]],
     ) -> str:
         """Build analysis prompt for LLM."""
-        prompt = f"""Analyze the following network topology data and provide insights:
+        # Sections are collected in a list and joined once (no repeated +=)
+        parts = [f"""Analyze the following network topology data and provide insights:
 
 ## Topology Summary
 - Total cells: {topology['total_cells']}
@@ -169,29 +170,33 @@ class CopilotService:
 - Unassigned cells: {len(topology.get('unassigned_cells', []))}
 
 ## Groups
-"""
-        for group in topology.get("groups", []):
-            prompt += f"- {group['group_name']} ({group['group_id']}): {group['cell_count']} cells, avg similarity: {group['avg_similarity']}\n"
+"""]
+        parts.extend(
+            f"- {group['group_name']} ({group['group_id']}): {group['cell_count']} cells, avg similarity: {group['avg_similarity']}\n"
+            for group in topology.get("groups", [])
+        )
         
         if anomaly:
-            prompt += f"""
+            parts.append(f"""
 ## Anomaly Analysis
 - Anomalies detected: {anomaly['anomalies_detected']}
 - Average confidence: {anomaly['statistics']['avg_confidence']}
-"""
-            for anom in anomaly.get("anomalies", [])[:3]:
-                prompt += f"- Cell {anom['cell_id']}: confidence {anom['confidence_score']}, severity {anom['severity']}\n"
+""")
+            parts.extend(
+                f"- Cell {anom['cell_id']}: confidence {anom['confidence_score']}, severity {anom['severity']}\n"
+                for anom in anomaly.get("anomalies", [])[:3]
+            )
         
         if propagation:
-            prompt += f"""
+            parts.append(f"""
 ## Propagation Analysis
 - Events detected: {len(propagation.get('events', []))}
 - Paths identified: {len(propagation.get('propagation_paths', []))}
-"""
+""")
         
-        prompt += "\nProvide 3 key insights and 2-3 recommendations."
+        parts.append("\nProvide 3 key insights and 2-3 recommendations.")
         
-        return prompt
+        return "".join(parts)
     
     def _generate_fallback_insights(
         self,
@@ -284,12 +289,14 @@ class CopilotService:
         """Extract structured insights."""
         insights = []
         insight_counter = 1
+        # One timestamp string shared by every insight in the report
+        timestamp = datetime.now(timezone.utc).isoformat()
         
         # Group-based insight
         groups = topology.get("groups", [])
         if groups:
-            sorted_groups = sorted(groups, key=lambda g: g["avg_similarity"])
-            weakest = sorted_groups[0]
+            # Only the lowest-similarity group is needed: O(n) min, no sort
+            weakest = min(groups, key=lambda g: g["avg_similarity"])
             insights.append({
                 "insight_id": f"ins_{insight_counter:03d}",
                 "type": "congestion_alert",
@@ -297,7 +304,7 @@ class CopilotService:
                 "title": f"Congestion Pattern in {weakest['group_name']}",
                 "description": f"{weakest['group_name']} ({weakest['group_id']}) shows correlation of {weakest['avg_similarity']:.2f} affecting {weakest['cell_count']} cells.",
                 "affected_entities": [weakest["group_id"]],
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": timestamp,
             })
             insight_counter += 1
         
@@ -311,7 +318,7 @@ class CopilotService:
                     "title": f"Cell {anom['cell_id']} Behaving Abnormally",
                     "description": anom.get("explanation", "Cell shows deviation from group behavior"),
                     "affected_entities": [anom["cell_id"]],
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "timestamp": timestamp,
                 })
                 insight_counter += 1
         
@@ -325,7 +332,7 @@ class CopilotService:
                 "title": "Cascading Congestion Pattern Identified",
                 "description": f"Congestion propagates through {' → '.join(path['sequence'])} with {path['total_delay_ms']:.1f}ms total delay.",
                 "affected_entities": path["sequence"],
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": timestamp,
             })
         
         return insights
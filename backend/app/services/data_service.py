@@ -22,6 +22,7 @@ class DataService:
         self,
         data_type: str,
         data: Optional[List[Dict[str, Any]]] = None,
+        columns: Optional[Dict[str, np.ndarray]] = None,
         file_url: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
@@ -31,6 +32,7 @@ class DataService:
         Args:
             data_type: Type of data (loss_events or throughput)
             data: Inline data records
+            columns: Inline data as validated column arrays (columnar upload)
             file_url: URL to data file (not implemented - placeholder)
             metadata: Optional metadata
             
@@ -40,7 +42,12 @@ class DataService:
         upload_id = generate_id("upl")
         
         # Process inline data
-        if data:
+        if columns is not None:
+            # Already validated by LossEventBatch; stored as-is (pd.DataFrame
+            # builds from a dict of columns just as from a list of records)
+            records = columns
+            records_count = len(columns["cell_id"])
+        elif data:
             records = data
             records_count = len(records)
         elif file_url:
@@ -53,14 +60,16 @@ class DataService:
             records = self._generate_sample_data(data_type)
             records_count = len(records)
         
-        # Validate data
-        self._validate_data(data_type, records)
-        
-        # Convert to DataFrame for processing
-        df = pd.DataFrame(records)
-        
-        # Extract cell IDs
-        cell_ids = sorted(df["cell_id"].unique().tolist())
+        if columns is not None:
+            if not records_count:
+                raise ValueError("No records provided")
+            cell_ids = np.unique(columns["cell_id"]).tolist()
+        else:
+            # Validate data
+            self._validate_data(data_type, records)
+            
+            # Extract cell IDs
+            cell_ids = sorted({record["cell_id"] for record in records})
         
         # Store the upload
         storage.store_upload(upload_id, {
@@ -91,47 +100,47 @@ class DataService:
         num_slots = 1000
         num_cells = 24
         
-        records = []
+        # Column arrays (slot-major, cells 1..num_cells within each slot)
+        slot_ids = np.repeat(np.arange(num_slots), num_cells)
+        cell_ids = np.tile(np.arange(1, num_cells + 1), num_slots)
         
         if data_type == "loss_events":
             # Generate correlated loss events to simulate shared links
             # Groups: [1,2,8,14], [3,6,9,15], [4,10,12,18], others independent
-            group1 = [1, 2, 8, 14]
-            group2 = [3, 6, 9, 15]
-            group3 = [4, 10, 12, 18]
+            groups = [
+                ([1, 2, 8, 14], 0.2, 0.8),     # (cells, congestion rate, loss prob)
+                ([3, 6, 9, 15], 0.15, 0.75),
+                ([4, 10, 12, 18], 0.1, 0.7),
+            ]
+            congestion_rates = np.array([rate for _, rate, _ in groups])
             
+            # Per cell: group index (len(groups) = independent) and loss prob
+            cell_group = np.full(num_cells, len(groups))
+            loss_prob = np.full(num_cells, 0.05)
+            for index, (cells, _, prob) in enumerate(groups):
+                cell_group[np.asarray(cells) - 1] = index
+                loss_prob[np.asarray(cells) - 1] = prob
+            
+            # Draws stay in the original per-slot order (congestion flags, then
+            # one draw per cell that can lose, by cell id), so seeded data is
+            # unchanged; cells in an uncongested group draw nothing
+            loss = np.zeros((num_slots, num_cells), dtype=bool)
             for slot in range(num_slots):
                 # Simulate congestion events at certain times
-                congestion1 = np.random.random() < 0.2  # 20% congestion rate
-                congestion2 = np.random.random() < 0.15
-                congestion3 = np.random.random() < 0.1
-                
-                for cell in range(1, num_cells + 1):
-                    if cell in group1:
-                        loss = 1 if congestion1 and np.random.random() < 0.8 else 0
-                    elif cell in group2:
-                        loss = 1 if congestion2 and np.random.random() < 0.75 else 0
-                    elif cell in group3:
-                        loss = 1 if congestion3 and np.random.random() < 0.7 else 0
-                    else:
-                        loss = 1 if np.random.random() < 0.05 else 0
-                    
-                    records.append({
-                        "slot_id": slot,
-                        "cell_id": cell,
-                        "loss_event": loss,
-                    })
+                congested = np.random.random(len(groups)) < congestion_rates
+                drawing = np.append(congested, True)[cell_group]
+                loss[slot, drawing] = np.random.random(drawing.sum()) < loss_prob[drawing]
+            
+            columns = {"loss_event": loss.ravel().astype(int)}
         else:  # throughput
-            for slot in range(num_slots):
-                for cell in range(1, num_cells + 1):
-                    throughput = 30 + np.random.normal(0, 5)
-                    records.append({
-                        "slot_id": slot,
-                        "cell_id": cell,
-                        "throughput_slot": round(throughput, 3),
-                    })
+            throughput = 30 + np.random.normal(0, 5, num_slots * num_cells)
+            columns = {"throughput_slot": np.round(throughput, 3)}
         
-        return records
+        return pd.DataFrame({
+            "slot_id": slot_ids,
+            "cell_id": cell_ids,
+            **columns,
+        }).to_dict("records")
     
     def _validate_data(self, data_type: str, records: List[Dict[str, Any]]) -> None:
         """Validate data format."""
@@ -9,7 +9,14 @@ loading from actual ML pipeline outputs.
 import sys
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.responses import orjson_dumps
+from app.providers.base import ChatMessage
+from app.providers.registry import get_provider
+from app.services.storage import storage
 
 # Add visualization to path
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
@@ -59,6 +66,36 @@ class FrontendService:
         
         return data
     
+    def get_similarity_matrix_binary(self) -> Dict[str, Any]:
+        """
+        Get the similarity matrix as a packed float32 buffer.
+        
+        Values are rounded like the JSON matrix and laid out row-major,
+        little-endian.
+        
+        Returns:
+            {
+                "data": bytes,  # n * n * 4 bytes
+                "shape": (n, n)
+            }
+        """
+        cache_key = "similarity_matrix_binary"
+        if self._is_cache_valid(cache_key):
+            return self._cache[cache_key]
+        
+        df, _ = load_similarity_matrix()
+        values = np.round(df.to_numpy(dtype=np.float64), 4).astype("<f4")
+        
+        data = {
+            "data": values.tobytes(),
+            "shape": values.shape,
+        }
+        
+        self._cache[cache_key] = data
+        self._cache_time[cache_key] = datetime.now(timezone.utc)
+        
+        return data
+    
     def get_cells(self, include_anomalies: bool = True) -> Dict[str, Any]:
         """
         Get cell data with anomaly information.
@@ -80,9 +117,6 @@ class FrontendService:
         # Optionally integrate with anomaly service
         if include_anomalies:
             try:
-                from app.services.anomaly_service import anomaly_service
-                from app.services.storage import storage
-                
                 # Get latest anomaly results if available
                 anomalies = storage.list_all("anomalies")
                 if anomalies:
@@ -142,7 +176,6 @@ class FrontendService:
         
         # Try to get from storage
         try:
-            from app.services.storage import storage
             propagations = storage.list_all("propagations")
             
             if propagations:
@@ -231,10 +264,7 @@ class FrontendService:
 - Groups: {', '.join([f"{g['name']} ({len(g['cells'])} cells)" for g in groups[:5]])}"""
         
         try:
-            from app.providers.ollama import OllamaProvider
-            from app.providers.base import ChatMessage
-            
-            provider = OllamaProvider()
+            provider = get_provider("ollama")
             
             messages = [
                 ChatMessage(
@@ -260,6 +290,25 @@ class FrontendService:
         
         return data
     
+    async def get_insights_llm_json(self) -> bytes:
+        """get_insights_llm() pre-encoded as JSON bytes."""
+        return self._encoded("insights_llm_json", await self.get_insights_llm())
+    
+    def _encoded(self, cache_key: str, data: Dict[str, Any]) -> bytes:
+        """
+        JSON bytes for a cached payload, encoded once per payload object.
+        
+        The bytes are stored next to the dict they came from and reused
+        for as long as the same dict is being served.
+        """
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        
+        body = orjson_dumps(data)
+        self._cache[cache_key] = (data, body)
+        return body
+    
     def _parse_llm_insights(self, llm_text: str) -> List[Dict[str, Any]]:
         """Parse LLM response into structured insights."""
         insights = []
@@ -328,10 +377,7 @@ Format each as: [TYPE] Title | Description
 Types: ACTION, MONITOR, INFO"""
         
         try:
-            from app.providers.ollama import OllamaProvider
-            from app.providers.base import ChatMessage
-            
-            provider = OllamaProvider()
+            provider = get_provider("ollama")
             
             messages = [
                 ChatMessage(
@@ -354,6 +400,10 @@ Types: ACTION, MONITOR, INFO"""
         
         return data
     
+    async def get_recommendations_llm_json(self) -> bytes:
+        """get_recommendations_llm() pre-encoded as JSON bytes."""
+        return self._encoded("recommendations_llm_json", await self.get_recommendations_llm())
+    
     def _parse_llm_recommendations(self, llm_text: str) -> List[Dict[str, Any]]:
         """Parse LLM response into recommendations."""
         recs = []
@@ -467,12 +517,21 @@ Types: ACTION, MONITOR, INFO"""
         Get complete application state in one call.
         Matches the example response format in InstructionsToIntegrate.md.
         """
-        matrix_data = self.get_similarity_matrix()
-        cells_data = self.get_cells()
-        groups_data = self.get_topology_groups()
-        events_data = self.get_propagation_events()
-        insights_data = self.get_insights()
-        
+        return self._assemble_state(*self._state_parts())
+    
+    def _state_parts(self) -> Tuple[Dict[str, Any], ...]:
+        """The payloads the complete state is built from."""
+        return (
+            self.get_similarity_matrix(),
+            self.get_cells(),
+            self.get_topology_groups(),
+            self.get_propagation_events(),
+            self.get_insights(),
+        )
+    
+    @staticmethod
+    def _assemble_state(matrix_data, cells_data, groups_data, events_data, insights_data) -> Dict[str, Any]:
+        """Combine the part payloads into the /state response."""
         return {
             "matrix": matrix_data["matrix"],
             "cellIds": matrix_data["cellIds"],
@@ -482,6 +541,25 @@ Types: ACTION, MONITOR, INFO"""
             "insights": insights_data["insights"]
         }
     
+    def get_complete_state_json(self) -> bytes:
+        """
+        get_complete_state() pre-encoded as JSON bytes.
+        
+        The bytes are reused only while every part is still the same object
+        they were encoded from, so a part reloaded from its sources (or new
+        LLM insights) re-encodes the state, as in _encoded().
+        """
+        cache_key = "complete_state_json"
+        parts = self._state_parts()
+        
+        cached = self._cache.get(cache_key)
+        if cached is not None and all(old is new for old, new in zip(cached[0], parts)):
+            return cached[1]
+        
+        body = orjson_dumps(self._assemble_state(*parts))
+        self._cache[cache_key] = (parts, body)
+        return body
+    
     def clear_cache(self):
         """Clear all cached data."""
         self._cache.clear()
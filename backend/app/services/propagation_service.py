@@ -101,13 +101,51 @@ class PropagationService:
         
         value_col = "loss_event" if "loss_event" in df.columns else "throughput_slot"
         
+        # Dense slot x cell accumulators, built once for all groups
+        slot_codes, slots = pd.factorize(df["slot_id"], sort=True)
+        cell_codes, cells = pd.factorize(df["cell_id"], sort=True)
+        values = df[value_col].to_numpy(dtype=np.float64)
+        
+        keyed = (slot_codes >= 0) & (cell_codes >= 0)
+        present = keyed & ~np.isnan(values)
+        flat_index = slot_codes * len(cells) + cell_codes
+        shape = (len(slots), len(cells))
+        size = shape[0] * shape[1]
+        
+        sums = np.bincount(
+            flat_index[present], weights=values[present], minlength=size
+        ).reshape(shape)
+        counts = np.bincount(flat_index[present], minlength=size).reshape(shape)
+        rows = np.bincount(flat_index[keyed], minlength=size).reshape(shape)
+        
+        # Columns of every group laid out back to back, then all per-group
+        # totals from one segmented reduction
+        group_cols = []
         for group in groups:
-            group_cells = [int(c) for c in group["cells"]]
-            group_df = df[df["cell_id"].isin(group_cells)]
+            cols = cells.get_indexer([int(c) for c in group["cells"]])
+            group_cols.append(np.unique(cols[cols >= 0]))
+        
+        sizes = np.array([len(cols) for cols in group_cols], dtype=np.int64)
+        non_empty = sizes > 0
+        
+        if non_empty.any():
+            all_cols = np.concatenate(group_cols)
+            starts = (np.cumsum(sizes) - sizes)[non_empty]
+            group_sums = np.add.reduceat(sums[:, all_cols], starts, axis=1)
+            group_counts = np.add.reduceat(counts[:, all_cols], starts, axis=1)
+            group_rows = np.add.reduceat(rows[:, all_cols], starts, axis=1)
+        
+        k = 0
+        for group, has_cells in zip(groups, non_empty):
+            if not has_cells:
+                signals[group["group_id"]] = np.array([])
+                continue
             
-            # Aggregate by slot
-            agg = group_df.groupby("slot_id")[value_col].mean()
-            signals[group["group_id"]] = agg.values
+            # Mean per slot over the group's rows; slots with no rows are skipped
+            has_rows = group_rows[:, k] > 0
+            with np.errstate(invalid="ignore", divide="ignore"):
+                signals[group["group_id"]] = group_sums[has_rows, k] / group_counts[has_rows, k]
+            k += 1
         
         return signals
     
@@ -167,21 +205,43 @@ class PropagationService:
         s1 = (signal1 - np.mean(signal1)) / (np.std(signal1) + 1e-8)
         s2 = (signal2 - np.mean(signal2)) / (np.std(signal2) + 1e-8)
         
-        # Compute cross-correlation
-        n = len(s1)
-        corrs = []
-        lags = range(-min(max_lag, n//2), min(max_lag, n//2) + 1)
-        
-        for lag in lags:
-            if lag >= 0:
-                c = np.corrcoef(s1[lag:], s2[:n-lag])[0, 1]
-            else:
-                c = np.corrcoef(s1[:n+lag], s2[-lag:])[0, 1]
-            corrs.append(c if not np.isnan(c) else 0)
-        
-        best_idx = np.argmax(np.abs(corrs))
-        best_corr = corrs[best_idx]
-        best_lag = list(lags)[best_idx]
+        # Compare over the common length
+        n = min(len(s1), len(s2))
+        s1, s2 = s1[:n], s2[:n]
+        max_shift = min(max_lag, n // 2)
+        lags = np.arange(-max_shift, max_shift + 1)
+        
+        # Lagged products for every lag at once: row r of the windows is
+        # s1 shifted by (r - max_shift), zero-padded outside the overlap
+        padded = np.concatenate([np.zeros(max_shift), s1, np.zeros(max_shift)])
+        windows = np.lib.stride_tricks.sliding_window_view(padded, n)
+        sum_xy = windows @ s2
+        
+        # Sums over each lag's overlapping ranges via prefix sums
+        start1, end1 = np.maximum(lags, 0), n + np.minimum(lags, 0)
+        start2, end2 = np.maximum(-lags, 0), n - np.maximum(lags, 0)
+        overlap = n - np.abs(lags)
+        
+        cum1 = np.concatenate([[0.0], np.cumsum(s1)])
+        cum1_sq = np.concatenate([[0.0], np.cumsum(s1 * s1)])
+        cum2 = np.concatenate([[0.0], np.cumsum(s2)])
+        cum2_sq = np.concatenate([[0.0], np.cumsum(s2 * s2)])
+        
+        sum_x = cum1[end1] - cum1[start1]
+        sum_y = cum2[end2] - cum2[start2]
+        cov = sum_xy - sum_x * sum_y / overlap
+        var_x = cum1_sq[end1] - cum1_sq[start1] - sum_x ** 2 / overlap
+        var_y = cum2_sq[end2] - cum2_sq[start2] - sum_y ** 2 / overlap
+        
+        # Pearson per lag; flat overlaps have no defined correlation -> 0
+        denom = np.sqrt(np.clip(var_x, 0, None) * np.clip(var_y, 0, None))
+        corrs = np.zeros(len(lags))
+        valid = denom > 1e-12
+        corrs[valid] = np.clip(cov[valid] / denom[valid], -1.0, 1.0)
+        
+        best_idx = int(np.argmax(np.abs(corrs)))
+        best_corr = float(corrs[best_idx])
+        best_lag = int(lags[best_idx])
         
         return abs(best_corr), best_lag
     
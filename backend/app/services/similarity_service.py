@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
+from scipy.spatial.distance import pdist, squareform
 
 from app.services.storage import storage, generate_id
 
@@ -55,21 +56,9 @@ class SimilarityService:
         unique_cells = sorted(df["cell_id"].unique().tolist())
         cell_id_strs = [str(c) for c in unique_cells]
         
-        # Create congestion vectors (pivot table)
-        if upload["data_type"] == "loss_events":
-            pivot = df.pivot_table(
-                index="slot_id",
-                columns="cell_id",
-                values="loss_event",
-                fill_value=0,
-            )
-        else:
-            pivot = df.pivot_table(
-                index="slot_id",
-                columns="cell_id",
-                values="throughput_slot",
-                fill_value=0,
-            )
+        # Create congestion vectors (slot x cell matrix)
+        value_col = "loss_event" if upload["data_type"] == "loss_events" else "throughput_slot"
+        pivot = self._build_cell_vectors(df, value_col)
         
         # Compute similarity matrix based on method
         if method == "correlation":
@@ -88,7 +77,8 @@ class SimilarityService:
         storage.store_similarity(similarity_id, {
             "similarity_id": similarity_id,
             "upload_id": upload_id,
-            "matrix": similarity_matrix.tolist(),
+            # Kept as one ndarray; the JSON list form is built on request
+            "matrix": similarity_matrix,
             "cell_ids": cell_id_strs,
             "method": method,
             "window_size": window_size,
@@ -106,21 +96,57 @@ class SimilarityService:
     def get_similarity(self, similarity_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve similarity matrix."""
         result = storage.get_similarity(similarity_id)
-        if result:
-            result["download_url"] = f"/topology/similarity/{similarity_id}/download"
-        return result
+        if not result:
+            return None
+        return {
+            **result,
+            "matrix": result["matrix"].tolist(),
+            "download_url": f"/topology/similarity/{similarity_id}/raw",
+        }
+    
+    def get_similarity_raw(self, similarity_id: str) -> Optional[np.ndarray]:
+        """Retrieve similarity matrix as a little-endian float32 array."""
+        result = storage.get_similarity(similarity_id)
+        if not result:
+            return None
+        return result["matrix"].astype("<f4")
+    
+    def _build_cell_vectors(self, df: pd.DataFrame, value_col: str) -> np.ndarray:
+        """
+        Build the slot x cell matrix of mean values, 0 where a cell has no
+        sample. Equivalent to pivot_table(fill_value=0) but accumulated with
+        bincount over factorized codes instead of a hash-based groupby.
+        """
+        slot_codes, slots = pd.factorize(df["slot_id"], sort=True)
+        cell_codes, cells = pd.factorize(df["cell_id"], sort=True)
+        values = df[value_col].to_numpy(dtype=np.float64)
+        
+        valid = ~np.isnan(values) & (slot_codes >= 0) & (cell_codes >= 0)
+        flat_index = slot_codes[valid] * len(cells) + cell_codes[valid]
+        size = len(slots) * len(cells)
+        
+        sums = np.bincount(flat_index, weights=values[valid], minlength=size)
+        counts = np.bincount(flat_index, minlength=size)
+        
+        vectors = np.zeros(size)
+        np.divide(sums, counts, out=vectors, where=counts > 0)
+        return vectors.reshape(len(slots), len(cells))
     
-    def _compute_correlation(self, pivot: pd.DataFrame) -> np.ndarray:
+    def _compute_correlation(self, pivot: np.ndarray) -> np.ndarray:
         """Compute Pearson correlation matrix."""
-        # Fill NaN with 0 for correlation computation
-        corr_matrix = pivot.corr().fillna(0).values.copy()  # Copy to make writable
+        # Pivot is zero-filled, so a dense pairwise pass over the upper
+        # triangle is enough (no NaN-aware pairwise corr needed)
+        cell_vectors = pivot.T
+        corr_matrix = 1.0 - squareform(pdist(cell_vectors, metric="correlation"))
+        # Constant cells have undefined correlation; treat as uncorrelated
+        np.nan_to_num(corr_matrix, copy=False)
         # Ensure diagonal is 1 and values are in [0, 1] range for similarity
         np.fill_diagonal(corr_matrix, 1.0)
         # Convert to similarity (handle negative correlations)
         similarity = (corr_matrix + 1) / 2  # Scale from [-1,1] to [0,1]
         return np.round(similarity, 4)
     
-    def _compute_dtw(self, pivot: pd.DataFrame) -> np.ndarray:
+    def _compute_dtw(self, pivot: np.ndarray) -> np.ndarray:
         """
         Compute DTW-based similarity matrix.
         Simplified implementation using correlation as fallback.
@@ -129,7 +155,7 @@ class SimilarityService:
         # Full DTW would require scipy or dtw-python
         return self._compute_correlation(pivot)
     
-    def _compute_mutual_info(self, pivot: pd.DataFrame) -> np.ndarray:
+    def _compute_mutual_info(self, pivot: np.ndarray) -> np.ndarray:
         """
         Compute mutual information-based similarity.
         Simplified implementation.
@@ -189,8 +189,8 @@ class InMemoryStorage:
         """Store batch job."""
         with self._lock:
             self._batches[batch_id] = {
-                **data,
                 "started_at": datetime.now(timezone.utc).isoformat(),
+                **data,
             }
             self._metrics["active_jobs"] += 1
     
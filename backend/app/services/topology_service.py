@@ -10,7 +10,6 @@ from typing import Any, Dict, List, Optional
 
 import numpy as np
 from scipy.cluster.hierarchy import linkage, fcluster
-from scipy.spatial.distance import squareform
 
 from app.services.storage import storage, generate_id
 
@@ -42,7 +41,7 @@ class TopologyService:
         if not similarity_data:
             raise ValueError(f"Similarity matrix not found: {similarity_id}")
         
-        matrix = np.array(similarity_data["matrix"])
+        matrix = similarity_data["matrix"]
         cell_ids = similarity_data["cell_ids"]
         
         # Convert similarity to distance
@@ -107,8 +106,8 @@ class TopologyService:
         threshold: float,
     ) -> np.ndarray:
         """Perform hierarchical clustering."""
-        # Convert to condensed form
-        condensed = squareform(distance_matrix, checks=False)
+        # Condensed form is the row-major upper triangle (no squareform copy)
+        condensed = distance_matrix[np.triu_indices(distance_matrix.shape[0], k=1)]
         
         # Linkage
         Z = linkage(condensed, method="average")
@@ -187,6 +186,8 @@ class TopologyService:
     ) -> List[Dict[str, Any]]:
         """Build cell assignment objects."""
         assignments = []
+        # One id string per label, shared by every cell assigned to it
+        group_ids = {label: f"Group_{label + 1}" for label in set(labels.tolist())}
         
         for i, (cell_id, label) in enumerate(zip(cell_ids, labels)):
             if label == -1:
@@ -197,7 +198,7 @@ class TopologyService:
             
             assignments.append({
                 "cell_id": cell_id,
-                "group_id": f"Group_{label + 1}",
+                "group_id": group_ids[label],
                 "confidence": round(confidence + np.random.uniform(-0.05, 0.05), 2),
             })
         
@@ -51,7 +51,7 @@ class VisualizationService:
         if not similarity:
             raise ValueError(f"Similarity matrix not found: {similarity_id}")
         
-        matrix = np.array(similarity["matrix"])
+        matrix = similarity["matrix"]
         cell_ids = similarity["cell_ids"]
         
         # Create heatmap
@@ -95,16 +95,15 @@ def load_clustering_data(
     
     # Normalize cell_id format
     if df["cell_id"].dtype in [int, np.int64]:
-        df["cell_id"] = df["cell_id"].apply(lambda x: f"cell_{int(x):02d}")
+        df["cell_id"] = "cell_" + df["cell_id"].astype(str).str.zfill(2)
     else:
         df["cell_id"] = df["cell_id"].astype(str).str.strip()
     
-    # Build group -> cells mapping
-    grouped_cells = {}
-    for _, row in df.iterrows():
-        grp = int(row["relative_group"])
-        cell = row["cell_id"]
-        grouped_cells.setdefault(grp, []).append(cell)
+    # Build group -> cells mapping (first-seen group order, row order within)
+    grouped_cells = {
+        int(grp): cells.tolist()
+        for grp, cells in df.groupby("relative_group", sort=False)["cell_id"]
+    }
     
     # Build group -> color mapping
     group_colors = {}
@@ -144,20 +143,31 @@ def build_topology_graph(
         for cell in cells:
             G.add_node(cell, group=grp, color=group_colors[grp])
     
-    # Add edges within same group
+    # Positional lookup into the similarity matrix (labels are bare cell numbers)
+    sim_values = None
+    if similarity_matrix is not None:
+        sim_values = similarity_matrix.to_numpy(dtype=float)
+        row_pos = {label: i for i, label in enumerate(similarity_matrix.index)}
+        col_pos = {label: j for j, label in enumerate(similarity_matrix.columns)}
+    
+    # Add edges within same group (all pairs of a group in one gather)
     for grp, cells in grouped_cells.items():
-        for i in range(len(cells)):
-            for j in range(i + 1, len(cells)):
-                weight = 1.0
-                if similarity_matrix is not None:
-                    try:
-                        # Extract numeric ID for lookup
-                        c1 = cells[i].replace("cell_", "").lstrip("0") or "0"
-                        c2 = cells[j].replace("cell_", "").lstrip("0") or "0"
-                        weight = similarity_matrix.loc[c1, c2]
-                    except (KeyError, IndexError):
-                        pass
-                G.add_edge(cells[i], cells[j], weight=weight, group=grp)
+        if len(cells) < 2:
+            continue
+        upper_i, upper_j = np.triu_indices(len(cells), k=1)
+        weights = np.ones(len(upper_i))
+        
+        if sim_values is not None:
+            keys = [cell.replace("cell_", "").lstrip("0") or "0" for cell in cells]
+            rows = np.array([row_pos.get(key, -1) for key in keys])[upper_i]
+            cols = np.array([col_pos.get(key, -1) for key in keys])[upper_j]
+            found = (rows >= 0) & (cols >= 0)
+            weights[found] = sim_values[rows[found], cols[found]]
+        
+        G.add_edges_from(
+            (cells[i], cells[j], {"weight": w, "group": grp})
+            for i, j, w in zip(upper_i, upper_j, weights)
+        )
     
     return G
 
@@ -380,22 +390,27 @@ def generate_cells_for_api(
     
     if anomaly_path.exists():
         try:
-            anomaly_df = pd.read_csv(anomaly_path)
+            anomaly_df = pd.read_csv(
+                anomaly_path,
+                usecols=["cell_id", "anomaly"],
+                dtype={"cell_id": "Int16", "anomaly": "Int8"},  # nullable: blanks stay NA
+            )
             # FIX: Use mean() to get anomaly RATE instead of max()
             # This gives the proportion of slots that are anomalous
-            cell_anomalies = anomaly_df.groupby("cell_id").agg({
-                "anomaly": "mean",     # Rate of anomalous slots (0.0 to 1.0)
-                "confidence": "mean"   # Average confidence across slots
-            }).reset_index()
+            # (per-cell mean as a bincount segmented sum over factorized ids)
+            cell_codes, cell_ids = pd.factorize(anomaly_df["cell_id"])
+            has_cell = cell_codes >= 0
+            cell_codes = cell_codes[has_cell]
+            anomaly_flags = anomaly_df["anomaly"].to_numpy(dtype=float, na_value=np.nan)[has_cell]
+            anomaly_rates = (
+                np.bincount(cell_codes, weights=anomaly_flags, minlength=len(cell_ids))
+                / np.bincount(cell_codes, minlength=len(cell_ids))
+            )  # Rate of anomalous slots (0.0 to 1.0)
             
             ANOMALY_RATE_THRESHOLD = 0.25  # Only flag if >25% of slots are anomalous
             
-            for _, row in cell_anomalies.iterrows():
-                cell_id = int(row["cell_id"])
-                anomaly_rate = float(row["anomaly"])
-                avg_confidence = float(row["confidence"])
-                
-                anomaly_data[cell_id] = {
+            for cell_id, anomaly_rate in zip(cell_ids.astype(int), anomaly_rates.tolist()):
+                anomaly_data[int(cell_id)] = {
                     "is_anomaly": anomaly_rate > ANOMALY_RATE_THRESHOLD,
                     "confidence": round(anomaly_rate, 3)  # Use rate as confidence
                 }
@@ -404,17 +419,17 @@ def generate_cells_for_api(
         except Exception as e:
             logger.warning(f"Failed to load anomaly data: {e}")
     
+    # Extract cell numbers for display names and anomaly lookup in one pass
+    cell_num_strs = df["cell_id"].str.replace("cell_", "", regex=False)
+    cell_nums = cell_num_strs.where(cell_num_strs.str.isdigit(), "0").astype(int)
+    group_ids = df["relative_group"].astype(int)
+    
+    no_anomaly = {"is_anomaly": False, "confidence": 0.0}
     cells = []
-    for _, row in df.iterrows():
-        cell_id = row["cell_id"]  # Format: "cell_XX"
-        group_id = int(row["relative_group"])
-        
-        # Extract cell number for display name and anomaly lookup
-        cell_num_str = cell_id.replace("cell_", "")
-        cell_num = int(cell_num_str) if cell_num_str.isdigit() else 0
-        
-        # Get anomaly info
-        anomaly_info = anomaly_data.get(cell_num, {"is_anomaly": False, "confidence": 0.0})
+    for cell_id, cell_num_str, cell_num, group_id in zip(
+        df["cell_id"], cell_num_strs, cell_nums, group_ids
+    ):
+        anomaly_info = anomaly_data.get(cell_num, no_anomaly)
         
         cells.append({
             "id": cell_id,